@@ -1,12 +1,16 @@
 """PDF Assessment Script - Characterize unprocessed PDFs for pipeline candidacy."""
 from __future__ import annotations
 
+import contextlib
+import io
 import re
 import sys
+from bisect import bisect_left
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 
 sys.path.insert(0, "C:/Users/Troy Davis/dev/personal/manual-chatbot/src")
-from pipeline import extract_pages
+from pipeline import iter_pages
 
 pdfs = [
     ("TM9-8015-1", "C:/Users/Troy Davis/dev/personal/manual-chatbot/data/TM9-8015-1.pdf"),
@@ -15,29 +19,161 @@ pdfs = [
     ("ORD_SNL_G-758", "C:/Users/Troy Davis/dev/personal/manual-chatbot/data/ORD_SNL_G-758.pdf"),
 ]
 
-for name, path in pdfs:
+# Structural markers are counted once per line but matched against the whole
+# page, so the regex engine scans each page in C instead of being called once
+# per line.  Lines are the pieces of p.split('\n'): under re.M, ^ only
+# matches after a '\n', and WS is whitespace other than '\n' (so '\r' and
+# friends still count as spaces within a line), keeping every match on a
+# single line.
+WS = r'[^\S\n]'
+
+# Line-start markers: with re.M each findall hit is a distinct line.
+CHAPTER_RE = re.compile(rf'^{WS}*CHAPTER{WS}+\d+', re.I | re.M)
+SECTION_RE = re.compile(rf'^{WS}*Section{WS}+[IVXLC]+', re.I | re.M)
+PARA_RE = re.compile(rf'^{WS}*\d+-\d+\.', re.M)
+TM_RE = re.compile(rf'^{WS}*TM{WS}+9-\d+', re.M)
+TABLE_RE = re.compile(rf'^{WS}*Table{WS}+\d+', re.I | re.M)
+WARN_RE = re.compile(rf'^{WS}*(?:WARNING|CAUTION|NOTE)\b', re.M)
+
+# Anywhere-in-line markers: several hits can share a line, see _count_lines().
+FIG_RE = re.compile(rf'[Ff]ig\.?{WS}*\d+')
+PART_RE = re.compile(r'\b\d{7}\b')
+TOC_RE = re.compile(rf'TABLE{WS}+OF{WS}+CONTENTS|CONTENTS', re.I)
+
+SAMPLE_CHARS = 500
+
+INDICATORS = {
+    "Parts list/catalog": ["parts list", "stock number", "national stock", "nsn", "nomenclature"],
+    "Wiring diagram": ["wiring diagram", "wiring harness", "circuit", "schematic"],
+    "Service/repair manual": ["maintenance", "repair", "troubleshooting", "inspection", "disassembly"],
+    "Operator manual": ["operator", "operation", "controls and instruments"],
+    "Lubrication order": ["lubrication order", "lubricant", "lube point"],
+    "Organizational maint.": ["organizational maintenance"],
+    "Direct/General support": ["direct support", "general support"],
+}
+
+# Flat (keyword, label) table.  Once a label is found its keywords are dropped,
+# so later pages are only searched for still-unresolved document types.
+INDICATOR_KEYWORDS = [(kw, label) for label, kws in INDICATORS.items() for kw in kws]
+
+# Printable-or-newline/tab flag for every Latin-1 code point, looked up by
+# ord(); only characters beyond U+00FF fall back to str.isprintable().
+PRINTABLE_LUT = bytes(
+    1 if chr(i).isprintable() or chr(i) in '\n\r\t' else 0 for i in range(256)
+)
+
+
+def _is_printable(c: str) -> bool:
+    o = ord(c)
+    return bool(PRINTABLE_LUT[o]) if o < 256 else c.isprintable()
+
+
+# Whole whitespace-delimited tokens of 4+ word characters that are not
+# decimal digits or '_', matched in C.  This is only a prefilter: the class
+# also admits numeric characters such as '²', '½' and 'Ⅱ', so matches are
+# kept only if ``w.isalpha()``, as with ``p.split()`` before.
+WORD_RE = re.compile(r'(?<!\S)[^\W\d_]{4,}(?!\S)')
+
+LINE_START_MARKERS = [
+    ("chapter", CHAPTER_RE),
+    ("section", SECTION_RE),
+    ("paragraph", PARA_RE),
+    ("tm_header", TM_RE),
+    ("table", TABLE_RE),
+    ("warning", WARN_RE),
+]
+IN_LINE_MARKERS = [
+    ("figure", FIG_RE),
+    ("part_number", PART_RE),
+    ("toc", TOC_RE),
+]
+
+
+def _count_lines(pat: re.Pattern, text: str) -> int:
+    """Count lines of *text* with at least one match of *pat*."""
+    count = 0
+    line_end = -1
+    for m in pat.finditer(text):
+        if m.start() > line_end:
+            count += 1
+            line_end = text.find('\n', m.start())
+            if line_end < 0:
+                line_end = len(text)
+    return count
+
+
+def _analyze(name: str, path: str) -> None:
     print(f"\n{'='*70}")
     print(f"ANALYZING: {name}")
     print(f"  Path: {path}")
     print(f"{'='*70}")
 
     try:
-        pages = extract_pages(path)
-        print(f"Total pages: {len(pages)}")
-        empty = sum(1 for p in pages if not p.strip())
+        # Single streaming pass: every statistic is accumulated page by page
+        # so the full document is never held in memory.  Only the first
+        # SAMPLE_CHARS of each non-empty page are kept, for the samples below.
+        page_count = 0
+        empty = 0
+        total_chars = 0
+        char_counts = Counter()
+        marker_counts = Counter()
+        word_freq = Counter()
+        found_indicators = set()
+        pending_keywords = INDICATOR_KEYWORDS
+        non_empty_indices: list[int] = []
+        previews: dict[int, str] = {}
+        for i, p in enumerate(iter_pages(path)):
+            page_count += 1
+            total_chars += len(p)
+            # One C-level counting pass per page (Counter.update); the
+            # character classes are then derived from the few hundred
+            # distinct characters instead of testing every character.
+            char_counts.update(p)
+            # isspace() answers the emptiness test without allocating a
+            # stripped copy of the page.
+            if not p or p.isspace():
+                empty += 1
+                continue
+            non_empty_indices.append(i)
+            previews[i] = p[:SAMPLE_CHARS]
+            for label, pat in LINE_START_MARKERS:
+                marker_counts[label] += len(pat.findall(p))
+            for label, pat in IN_LINE_MARKERS:
+                marker_counts[label] += _count_lines(pat, p)
+            word_freq.update(map(str.lower, filter(str.isalpha, WORD_RE.findall(p))))
+            # Once every indicator group has resolved, skip the lowercase
+            # copy and keyword scan for the rest of the document.
+            if pending_keywords:
+                lowered = p.lower()
+                hits = {label for kw, label in pending_keywords if kw in lowered}
+                if hits:
+                    found_indicators |= hits
+                    pending_keywords = [
+                        (kw, label) for kw, label in pending_keywords if label not in hits
+                    ]
+
+        print(f"Total pages: {page_count}")
         print(f"Empty pages: {empty}")
 
-        total_chars = sum(len(p) for p in pages)
-        printable_chars = sum(
-            sum(1 for c in p if c.isprintable() or c in '\n\r\t') for p in pages
-        )
+        # Every character-class total comes from one walk over the distinct
+        # characters in char_counts rather than one pass over the text each.
+        printable_chars = alpha_chars = digit_chars = space_chars = 0
+        for c, n in char_counts.items():
+            if _is_printable(c):
+                printable_chars += n
+            if c.isalpha():
+                alpha_chars += n
+            elif c.isdigit():
+                digit_chars += n
+            elif c.isspace():
+                space_chars += n
         if total_chars > 0:
             print(f"Total characters: {total_chars:,}")
             print(f"Printable ratio: {printable_chars/total_chars:.4f} ({printable_chars/total_chars*100:.1f}%)")
 
-        non_empty_pages = [p for p in pages if p.strip()]
-        avg_chars = total_chars / max(len(pages), 1)
-        avg_chars_nonempty = total_chars / max(len(non_empty_pages), 1) if non_empty_pages else 0
+        non_empty_count = len(non_empty_indices)
+        avg_chars = total_chars / max(page_count, 1)
+        avg_chars_nonempty = total_chars / max(non_empty_count, 1) if non_empty_count else 0
         print(f"Avg chars/page (all): {avg_chars:.0f}")
         print(f"Avg chars/page (non-empty): {avg_chars_nonempty:.0f}")
         if avg_chars < 50:
@@ -46,67 +182,37 @@ for name, path in pdfs:
             print("  ** WARNING: Low text content - may be partially scanned or diagram-heavy")
 
         print(f"\n--- SAMPLE PAGES (first 500 chars, newlines shown as \n) ---")
-        shown = 0
-        for i, text in enumerate(pages):
-            if not text.strip():
-                continue
-            display = text[:500].replace('\n', '\n')
+        for i in non_empty_indices[:5]:
+            display = previews[i].replace('\n', '\n')
             print(f"\n  Page {i}: {display}")
-            shown += 1
-            if shown >= 5:
-                break
-
-        if len(non_empty_pages) > 10:
-            mid = len(pages) // 2
-            for offset in range(20):
-                for try_idx in [mid + offset, mid - offset]:
-                    if 0 <= try_idx < len(pages) and pages[try_idx].strip():
-                        text = pages[try_idx][:500].replace('\n', '\n')
-                        print(f"\n  Page {try_idx} (near middle): {text}")
-                        break
-                else:
-                    continue
-                break
-
-        for i in range(len(pages) - 1, -1, -1):
-            if pages[i].strip():
-                text = pages[i][:500].replace('\n', '\n')
-                print(f"\n  Page {i} (last non-empty): {text}")
-                break
+
+        if non_empty_count > 10:
+            # Nearest non-empty page to the middle, within 19 pages; on a
+            # tie the later page wins (it is listed first in candidates).
+            mid = page_count // 2
+            j = bisect_left(non_empty_indices, mid)
+            candidates = [non_empty_indices[k] for k in (j, j - 1) if 0 <= k < non_empty_count]
+            near = min(candidates, key=lambda idx: abs(idx - mid))
+            if abs(near - mid) < 20:
+                text = previews[near].replace('\n', '\n')
+                print(f"\n  Page {near} (near middle): {text}")
+
+        if non_empty_indices:
+            i = non_empty_indices[-1]
+            text = previews[i].replace('\n', '\n')
+            print(f"\n  Page {i} (last non-empty): {text}")
 
         print(f"\n--- STRUCTURAL MARKER ANALYSIS ---")
-        chapter_count = sum(1 for p in pages for line in p.split('\n')
-                           if re.match(r'^\s*CHAPTER\s+\d+', line, re.I))
-        section_count = sum(1 for p in pages for line in p.split('\n')
-                           if re.match(r'^\s*Section\s+[IVXLC]+', line, re.I))
-        paragraph_count = sum(1 for p in pages for line in p.split('\n')
-                              if re.match(r'^\s*\d+-\d+\.', line))
-        tm_header_count = sum(1 for p in pages for line in p.split('\n')
-                              if re.match(r'^\s*TM\s+9-\d+', line))
-        fig_count = sum(1 for p in pages for line in p.split('\n')
-                        if re.search(r'[Ff]ig\.?\s*\d+', line))
-        table_count = sum(1 for p in pages for line in p.split('\n')
-                          if re.match(r'^\s*Table\s+\d+', line, re.I))
-        warning_count = sum(1 for p in pages for line in p.split('\n')
-                            if re.match(r'^\s*(WARNING|CAUTION|NOTE)\b', line))
-        part_number_count = sum(1 for p in pages for line in p.split('\n')
-                                if re.search(r'\b\d{7}\b', line))
-        toc_markers = sum(1 for p in pages for line in p.split('\n')
-                          if re.search(r'TABLE\s+OF\s+CONTENTS|CONTENTS', line, re.I))
-
-        print(f"  CHAPTER headers: {chapter_count}")
-        print(f"  Section headers: {section_count}")
-        print(f"  Paragraph markers (e.g., 3-1.): {paragraph_count}")
-        print(f"  TM headers: {tm_header_count}")
-        print(f"  Figure references: {fig_count}")
-        print(f"  Table references: {table_count}")
-        print(f"  WARNING/CAUTION/NOTE: {warning_count}")
-        print(f"  7-digit part/NSN numbers: {part_number_count}")
-        print(f"  TOC markers: {toc_markers}")
-
-        alpha_chars = sum(1 for p in pages for c in p if c.isalpha())
-        digit_chars = sum(1 for p in pages for c in p if c.isdigit())
-        space_chars = sum(1 for p in pages for c in p if c.isspace())
+        print(f"  CHAPTER headers: {marker_counts['chapter']}")
+        print(f"  Section headers: {marker_counts['section']}")
+        print(f"  Paragraph markers (e.g., 3-1.): {marker_counts['paragraph']}")
+        print(f"  TM headers: {marker_counts['tm_header']}")
+        print(f"  Figure references: {marker_counts['figure']}")
+        print(f"  Table references: {marker_counts['table']}")
+        print(f"  WARNING/CAUTION/NOTE: {marker_counts['warning']}")
+        print(f"  7-digit part/NSN numbers: {marker_counts['part_number']}")
+        print(f"  TOC markers: {marker_counts['toc']}")
+
         other_chars = total_chars - alpha_chars - digit_chars - space_chars
         print(f"\n--- CHARACTER DISTRIBUTION ---")
         print(f"  Alpha: {alpha_chars:,} ({alpha_chars/max(total_chars,1)*100:.1f}%)")
@@ -114,25 +220,12 @@ for name, path in pdfs:
         print(f"  Space: {space_chars:,} ({space_chars/max(total_chars,1)*100:.1f}%)")
         print(f"  Other: {other_chars:,} ({other_chars/max(total_chars,1)*100:.1f}%)")
 
-        all_words = []
-        for p in pages:
-            all_words.extend(w.lower() for w in p.split() if len(w) > 3 and w.isalpha())
-        word_freq = Counter(all_words)
         print(f"\n--- TOP 30 WORDS (len>3, alpha only) ---")
         for word, count in word_freq.most_common(30):
             print(f"  {word:20s} {count:5d}")
 
         print(f"\n--- DOCUMENT TYPE INDICATORS ---")
-        full_text = "\n".join(pages).lower()
-        indicators = {
-            "Parts list/catalog": any(kw in full_text for kw in ["parts list", "stock number", "national stock", "nsn", "nomenclature"]),
-            "Wiring diagram": any(kw in full_text for kw in ["wiring diagram", "wiring harness", "circuit", "schematic"]),
-            "Service/repair manual": any(kw in full_text for kw in ["maintenance", "repair", "troubleshooting", "inspection", "disassembly"]),
-            "Operator manual": any(kw in full_text for kw in ["operator", "operation", "controls and instruments"]),
-            "Lubrication order": any(kw in full_text for kw in ["lubrication order", "lubricant", "lube point"]),
-            "Organizational maint.": any(kw in full_text for kw in ["organizational maintenance"]),
-            "Direct/General support": any(kw in full_text for kw in ["direct support", "general support"]),
-        }
+        indicators = {label: label in found_indicators for label in INDICATORS}
         for label, found in indicators.items():
             print(f"  {label:30s} {'YES' if found else 'no'}")
 
@@ -141,6 +234,32 @@ for name, path in pdfs:
         import traceback
         traceback.print_exc()
 
-print(f"\n{'='*70}")
-print("ASSESSMENT COMPLETE")
-print(f"{'='*70}")
+
+def analyze_pdf(name: str, path: str) -> str:
+    """Assess one PDF and return its formatted report.
+
+    Output is captured per PDF so reports from parallel workers print
+    as whole blocks instead of interleaving.
+    """
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        _analyze(name, path)
+    return buf.getvalue()
+
+
+def main() -> None:
+    names = [name for name, _ in pdfs]
+    paths = [path for _, path in pdfs]
+    # Each PDF is independent (extraction + text scans), so assess them in
+    # separate processes; map() yields reports in the original PDF order.
+    with ProcessPoolExecutor(max_workers=len(pdfs)) as executor:
+        for report in executor.map(analyze_pdf, names, paths):
+            sys.stdout.write(report)
+
+    print(f"\n{'='*70}")
+    print("ASSESSMENT COMPLETE")
+    print(f"{'='*70}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""On-disk memoization of PDF extraction and OCR cleanup for the QA scripts.
+
+validate_cj.py, validate_tm9.py and qa_details.py re-extract the same
+multi-hundred-page PDFs on every run.  These helpers pickle the results under
+``output/.cache`` so iterating on a profile only re-runs the stages
+downstream of whatever actually changed:
+
+- extracted pages are keyed on (absolute PDF path, mtime)
+- cleaned pages are keyed on (hash of the page texts, profile YAML bytes)
+
+Both keys also include ``CACHE_VERSION`` and a hash of the ``pipeline``
+package sources, so editing the extraction or cleanup code invalidates
+earlier results.  (assess_pdfs.py streams pages through ``iter_pages`` and
+does not use this cache.)
+"""
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pipeline
+from pipeline import extract_pages
+from pipeline.ocr_cleanup import CleanedPage, clean_page
+from pipeline.profile import ManualProfile
+
+CACHE_DIR = Path(__file__).resolve().parent / ".cache"
+
+# Bump when the pickled layout or the meaning of a key changes.
+CACHE_VERSION = 1
+
+
+@functools.lru_cache(maxsize=None)
+def _code_fingerprint() -> str:
+    """Cache version plus a hash of every ``pipeline`` source file."""
+    digest = hashlib.sha1(f"v{CACHE_VERSION}".encode())
+    package_dir = Path(pipeline.__file__).resolve().parent
+    for source in sorted(package_dir.glob("*.py")):
+        digest.update(source.name.encode())
+        digest.update(b"\0")
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def _load(key: str):
+    path = CACHE_DIR / f"{key}.pkl"
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        # Truncated, stale or otherwise unreadable entries are just misses.
+        return None
+
+
+def _store(key: str, value) -> None:
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = CACHE_DIR / f"{key}.pkl.tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, CACHE_DIR / f"{key}.pkl")
+
+
+@functools.lru_cache(maxsize=None)
+def _extract_pages_cached(pdf_path: str, mtime: float) -> tuple[str, ...]:
+    key = "pages-" + hashlib.sha1(
+        f"{_code_fingerprint()}|{pdf_path}|{mtime}".encode()
+    ).hexdigest()
+    pages = _load(key)
+    if pages is None:
+        pages = extract_pages(pdf_path)
+        _store(key, pages)
+    return tuple(pages)
+
+
+def cached_extract_pages(pdf_path: str | Path) -> list[str]:
+    """``extract_pages`` memoized in-process and on disk by path and mtime."""
+    pdf_path = os.path.abspath(pdf_path)
+    return list(_extract_pages_cached(pdf_path, os.path.getmtime(pdf_path)))
+
+
+_worker_profile: ManualProfile | None = None
+
+
+def _init_worker(profile: ManualProfile) -> None:
+    global _worker_profile
+    _worker_profile = profile
+
+
+def _clean_one(item: tuple[int, str]) -> CleanedPage:
+    i, page = item
+    return clean_page(page, i, _worker_profile)
+
+
+def clean_pages_parallel(pages: list[str], profile: ManualProfile) -> list[CleanedPage]:
+    """Run ``clean_page`` over every page across worker processes.
+
+    Pages are independent and cleanup is CPU-bound regex work, so this
+    scales with cores.  The profile is sent once per worker through the
+    pool initializer rather than with every task.  Callers must run under
+    an ``if __name__ == "__main__"`` guard (spawn start method).
+    """
+    with ProcessPoolExecutor(initializer=_init_worker, initargs=(profile,)) as ex:
+        return list(ex.map(_clean_one, enumerate(pages), chunksize=16))
+
+
+def cached_clean_pages(
+    pages: list[str], profile: ManualProfile, profile_path: str | Path
+) -> list[CleanedPage]:
+    """``clean_page`` over every page, memoized on disk.
+
+    The key combines a hash of the page texts with the raw bytes of the
+    profile YAML and the pipeline code fingerprint, so editing the profile
+    or the cleanup code invalidates the cleanup results.
+    """
+    digest = hashlib.sha1(_code_fingerprint().encode())
+    for page in pages:
+        digest.update(page.encode("utf-8", "surrogatepass"))
+        digest.update(b"\0")
+    digest.update(Path(profile_path).read_bytes())
+    key = "cleaned-" + digest.hexdigest()
+
+    cleaned = _load(key)
+    if cleaned is None:
+        cleaned = clean_pages_parallel(pages, profile)
+        _store(key, cleaned)
+    return cleaned
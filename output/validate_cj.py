@@ -1,4 +1,4 @@
-import sys, traceback, statistics
+import contextlib, io, sys, traceback, statistics
 from collections import Counter
 
 sys.path.insert(0, "C:/Users/Troy Davis/dev/personal/manual-chatbot/src")
@@ -28,8 +28,8 @@ def main():
     print()
 
     print(SEP); print("STAGE 1: PDF EXTRACTION"); print(SEP)
-    from pipeline import extract_pages
-    pages = extract_pages(PDF)
+    from page_cache import cached_extract_pages
+    pages = cached_extract_pages(PDF)
     print(f"Pages: {len(pages)}")
     empty = sum(1 for p in pages if not p.strip())
     print(f"Empty pages: {empty}")
@@ -42,8 +42,9 @@ def main():
     print()
 
     print(SEP); print("STAGE 2: OCR CLEANUP"); print(SEP)
-    from pipeline.ocr_cleanup import clean_page, assess_quality
-    cleaned = [clean_page(page, i, profile) for i, page in enumerate(pages)]
+    from pipeline.ocr_cleanup import assess_quality
+    from page_cache import cached_clean_pages
+    cleaned = cached_clean_pages(pages, profile, PROF)
     q = assess_quality(cleaned)
     print(f"Dict match rate: {q.dictionary_match_rate:.3f}")
     print(f"Garbage line rate: {q.garbage_line_rate:.3f}")
@@ -118,23 +119,25 @@ def main():
     print(f"Token stats: min={min(toks)}, max={max(toks)}, mean={statistics.mean(toks):.0f}, median={statistics.median(toks):.0f}")
     if len(toks) > 1:
         print(f"  stdev={statistics.stdev(toks):.0f}")
-    us = sum(1 for t in toks if t < 200)
-    ov = sum(1 for t in toks if t > 2000)
-    ir = sum(1 for t in toks if 200 <= t <= 2000)
+    us = ov = 0
+    for t in toks:
+        if t < 200:
+            us += 1
+        elif t > 2000:
+            ov += 1
     n = len(chunks)
+    ir = n - us - ov
     print(f"Undersized(<200): {us} ({us/n*100:.1f}%)")
     print(f"In range(200-2000): {ir} ({ir/n*100:.1f}%)")
     print(f"Oversized(>2000): {ov} ({ov/n*100:.1f}%)")
-    bkts = [0]*10
-    for t in toks:
-        bkts[min(t//200, 9)] += 1
+    bucket_counts = Counter(min(t // 200, 9) for t in toks)
+    bkts = [bucket_counts[b] for b in range(10)]
     print("Token histogram:")
     labs = ["0-199","200-399","400-599","600-799","800-999","1000-1199","1200-1399","1400-1599","1600-1799","1800+"]
     for lb, ct in zip(labs, bkts):
         print(f"  {lb:>10}: {ct:4d} " + "#"*min(ct,60))
     print("First 10 chunks:")
-    for c in chunks[:10]:
-        t = count_tokens(c.text)
+    for t, c in zip(toks[:10], chunks):
         print(f"  {c.chunk_id} ({t} tok): {c.text[:120].replace(NL, PIPE)}...")
     sbs = sorted(zip(toks, chunks), key=lambda x: x[0])
     print("5 smallest:")
@@ -181,8 +184,14 @@ def main():
     print(f"QA: passed={rpt.passed}, errors={rpt.error_count}, warnings={rpt.warning_count}")
 
 if __name__ == "__main__":
+    # Collect the report in memory and write it once; thousands of small
+    # print() calls are slow on Windows consoles.
+    buf = io.StringIO()
     try:
-        main()
+        with contextlib.redirect_stdout(buf):
+            main()
     except Exception as e:
-        print(f"FATAL ERROR: {e}")
+        print(f"FATAL ERROR: {e}", file=buf)
         traceback.print_exc()
+    finally:
+        sys.stdout.write(buf.getvalue())
@@ -2,29 +2,55 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
 
 
-def extract_pages(pdf_path: str | Path) -> list[str]:
-    """Extract text from each page of a PDF using pymupdf.
+def iter_pages(pdf_path: str | Path) -> Iterator[str]:
+    """Lazily yield the text of each page of a PDF using pymupdf.
+
+    Single-pass consumers (statistics, word counts) can use this instead
+    of ``extract_pages`` to avoid holding every page in memory at once.
+    The document stays open until the iterator is exhausted or closed.
 
     Args:
         pdf_path: Path to the PDF file.
 
     Returns:
-        List of strings, one per page.
+        Iterator of strings, one per page.
 
     Raises:
-        FileNotFoundError: If the PDF file does not exist.
+        FileNotFoundError: If the PDF file does not exist (raised on call,
+            not on first iteration).
     """
     pdf_path = Path(pdf_path)
     if not pdf_path.exists():
         raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+    return _iter_page_text(pdf_path)
 
+
+def _iter_page_text(pdf_path: Path) -> Iterator[str]:
     import pymupdf
 
-    pages: list[str] = []
+    # Plain-text extraction only: TEXTFLAGS_TEXT leaves out image blocks,
+    # and sort=False keeps content-stream order since the structural parser
+    # re-detects boundaries from the line text anyway.  Both are pinned here
+    # so a pymupdf default change can't silently alter extraction output.
     with pymupdf.open(str(pdf_path)) as doc:
         for page in doc:
-            pages.append(page.get_text())
-    return pages
+            yield page.get_text("text", flags=pymupdf.TEXTFLAGS_TEXT, sort=False)
+
+
+def extract_pages(pdf_path: str | Path) -> list[str]:
+    """Extract text from each page of a PDF using pymupdf.
+
+    Args:
+        pdf_path: Path to the PDF file.
+
+    Returns:
+        List of strings, one per page.
+
+    Raises:
+        FileNotFoundError: If the PDF file does not exist.
+    """
+    return list(iter_pages(pdf_path))
@@ -2,22 +2,40 @@
 
 from __future__ import annotations
 
+import bisect
+import functools
+import itertools
 import json
 import logging
+import os
 import re
-from dataclasses import asdict, dataclass, field
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from .profile import ManualProfile
+from .profile import ManualProfile, compile_pattern
 from .structural_parser import Manifest, ManifestEntry
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Chunk:
-    """A fully assembled chunk with text and metadata."""
+    """A fully assembled chunk with text and metadata.
+
+    Chunks are immutable; rules that merge chunks build a new one.  Their
+    ``chunk_id`` and ``manual_id`` are interned where chunks are created,
+    so every chunk of a manual shares one ``manual_id`` string and equal
+    ids are usually the same object, letting ``==`` and dict lookups take
+    the identity shortcut before comparing characters.  Hashing and
+    equality are still by value, so this is only a speedup: chunks
+    unpickled from ``assemble_chunks`` worker processes are not interned
+    and behave the same.
+    """
     chunk_id: str
     manual_id: str
     text: str
@@ -48,9 +66,88 @@ def count_tokens(text: str) -> int:
     (e.g., strict model context limits), swap this implementation
     for a BPE tokenizer.
     """
-    if not text or not text.strip():
-        return 0
-    return int(len(text.split()) * TOKEN_ESTIMATE_FACTOR)
+    # str.split() already yields no words for empty or whitespace-only
+    # text, so no separate strip() copy is needed to detect those.
+    return _tokens(len(text.split()))
+
+
+def _tokens(word_count: int) -> int:
+    """Token estimate for a known word count (``count_tokens`` without the split)."""
+    return int(word_count * TOKEN_ESTIMATE_FACTOR)
+
+
+# Constructs that change meaning once a pattern is one branch of a larger
+# alternation: numbered or named back-references and conditional group
+# references would point at another branch's groups, and an inline global
+# flag group such as "(?i)" would apply to every branch (Python 3.10 only
+# warns about one that is not at the start instead of raising).
+_UNION_UNSAFE_RE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(|\(\?[aiLmsux]+\)")
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_any(patterns: tuple[tuple[str, int], ...]) -> re.Pattern[str] | None:
+    """Union of ``(pattern, flags)`` pairs into one alternation.
+
+    ``_compile_any(...).search(s)`` succeeds exactly when ``search`` on any
+    individual pattern would, so a list of patterns can be tested against a
+    line with a single regex call.  IGNORECASE is preserved per branch with
+    a scoped ``(?i:...)`` group.  Returns None when the patterns cannot be
+    combined safely (back-references, conditional group references, inline
+    global flags, other flags), in which case callers fall back to testing
+    each pattern.
+    """
+    if not patterns:
+        return None
+    branches = []
+    for pattern, flags in patterns:
+        if flags & ~re.IGNORECASE or _UNION_UNSAFE_RE.search(pattern):
+            return None
+        branches.append(f"(?i:{pattern})" if flags else f"(?:{pattern})")
+    try:
+        return re.compile("|".join(branches))
+    except re.error:
+        return None
+
+
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+@functools.lru_cache(maxsize=None)
+def _literal_prefix(pattern: str) -> str:
+    """Literal text that every match of *pattern* must contain, or "".
+
+    This is the run of plain or backslash-escaped metacharacters (``\\(``,
+    ``\\.``) after an optional leading ``^``; a character followed by an
+    optional quantifier (``*``, ``?``, ``{``) is dropped, and patterns with
+    alternation get no literal at all.
+    """
+    if "|" in pattern:
+        return ""
+    body = pattern[1:] if pattern.startswith("^") else pattern
+    literal: list[str] = []
+    pos = 0
+    while pos < len(body):
+        char = body[pos]
+        if char == "\\" and pos + 1 < len(body) and body[pos + 1] in _REGEX_METACHARACTERS:
+            literal.append(body[pos + 1])
+            pos += 2
+        elif char not in _REGEX_METACHARACTERS:
+            literal.append(char)
+            pos += 1
+        else:
+            break
+    if literal and pos < len(body) and body[pos] in "*?{":
+        literal.pop()
+    return "".join(literal)
+
+
+def _any_search(
+    union: re.Pattern[str] | None, compiled: list[re.Pattern[str]], text: str
+) -> bool:
+    """True if any of *compiled* matches *text*, via *union* when available."""
+    if union is not None:
+        return union.search(text) is not None
+    return any(pat.search(text) for pat in compiled)
 
 
 def compose_hierarchical_header(
@@ -60,8 +157,17 @@ def compose_hierarchical_header(
 
     Format: {manual_title} | {level1_title} | {level2_title} | ...
     """
-    parts = [profile.manual_title] + list(hierarchy_path)
-    return " | ".join(parts)
+    return _compose_header(profile.manual_title, tuple(hierarchy_path))
+
+
+@functools.lru_cache(maxsize=4096)
+def _compose_header(manual_title: str, hierarchy_path: tuple[str, ...]) -> str:
+    """Cached join for ``compose_hierarchical_header``.
+
+    Every chunk under one hierarchy node shares the same header, so each
+    distinct path is joined once and the same string is reused.
+    """
+    return " | ".join((manual_title,) + hierarchy_path)
 
 
 def detect_step_sequences(text: str, step_patterns: list[str]) -> list[tuple[int, int]]:
@@ -69,26 +175,106 @@ def detect_step_sequences(text: str, step_patterns: list[str]) -> list[tuple[int
 
     Returns list of (start_line, end_line) tuples for each detected sequence.
     """
-    lines = text.split("\n")
-    compiled = [re.compile(p) for p in step_patterns]
-
-    # Mark which lines match a step pattern
-    step_lines: list[int] = []
-    for i, line in enumerate(lines):
+    if not _may_contain_steps(text, step_patterns):
+        return []
+    return _step_sequences(text, step_patterns)
+
+
+def _may_contain_steps(text: str, step_patterns: list[str]) -> bool:
+    """False when no line of *text* can match any of *step_patterns*."""
+    # A step line is a substring of the text, so when every pattern needs a
+    # literal (such as "(" for "(1) ") that the text lacks, no line can match.
+    literals = [_literal_prefix(p) for p in step_patterns]
+    return not all(literals) or any(lit in text for lit in literals)
+
+
+# Constructs whose meaning depends on what surrounds a stripped line in the
+# text: alternation, anchors other than the leading "^", lookaround, inline
+# flags and back-references.  A step pattern using any of them is not
+# rewritten into a line scan (see _step_line_scan).
+_LINE_SCAN_UNSAFE_RE = re.compile(r"\||\$|\\[AZ1-9]|\(\?(?!:|P<)|(?<!\[)\^")
+
+
+@functools.lru_cache(maxsize=None)
+def _step_line_scan(
+    step_patterns: tuple[str, ...]
+) -> tuple[re.Pattern[str], re.Pattern[str]] | None:
+    """Patterns that find the lines of a text that may be step lines.
+
+    Step patterns are anchored with "^" and searched in each stripped line.
+    Behind leading whitespace, every such match is also a match in the
+    unsplit text, so the first pattern (tried at the start of the text) and
+    the second (a newline followed by a possible step) find a superset of
+    the step lines in one pass.  The second starts with a literal newline,
+    which the regex engine skips to directly instead of trying a line
+    anchor at every position.  Returns None for unanchored or context-
+    dependent patterns, which are searched line by line.
+    """
+    bodies = []
+    for pattern in step_patterns:
+        if not pattern.startswith("^") or _LINE_SCAN_UNSAFE_RE.search(pattern, 1):
+            return None
+        bodies.append(f"(?:{pattern[1:]})")
+    body = "|".join(bodies)
+    try:
+        return (
+            re.compile(rf"[^\S\n]*(?:{body})"),
+            re.compile(rf"\n(?=[^\S\n]*(?:{body}))"),
+        )
+    except re.error:
+        return None
+
+
+def _candidate_step_lines(
+    text: str, first: re.Pattern[str], rest: re.Pattern[str]
+) -> Iterator[tuple[int, str]]:
+    """(line number, line) for each line of *text* found by ``_step_line_scan``."""
+    if first.match(text):
+        end = text.find("\n")
+        yield 0, text[:end] if end >= 0 else text
+    line_no = 0
+    pos = 0
+    for m in rest.finditer(text):
+        # Newlines between the previous line start and this line's newline
+        line_no += text.count("\n", pos, m.start()) + 1
+        pos = m.end()
+        end = text.find("\n", pos)
+        yield line_no, text[pos:end] if end >= 0 else text[pos:]
+
+
+def _step_sequences(text: str, step_patterns: list[str]) -> list[tuple[int, int]]:
+    """``detect_step_sequences`` without the literal pre-check."""
+    compiled = [compile_pattern(p) for p in step_patterns]
+    any_step = _compile_any(tuple((p, 0) for p in step_patterns))
+
+    # Mark which lines match a step pattern; each line is stripped once and
+    # step lines keep theirs for the restart check below.  Only candidate
+    # lines from the scan are tested when the patterns allow one.
+    scan = _step_line_scan(tuple(step_patterns))
+    if scan is None:
+        candidates: Iterable[tuple[int, str]] = enumerate(text.split("\n"))
+    else:
+        candidates = _candidate_step_lines(text, *scan)
+    step_stripped: dict[int, str] = {}
+    for i, line in candidates:
         stripped = line.strip()
-        for pat in compiled:
-            if pat.search(stripped):
-                step_lines.append(i)
-                break
+        if _any_search(any_step, compiled, stripped):
+            step_stripped[i] = stripped
 
-    if not step_lines:
+    if not step_stripped:
         return []
+    step_lines = list(step_stripped)
 
     # Group contiguous step lines (allowing gaps of at most 1 non-step line
     # between steps for continuation lines)
     sequences: list[tuple[int, int]] = []
     seq_start = step_lines[0]
     seq_end = step_lines[0]
+    # Per-pattern matches (by pattern index) of the current line of the
+    # last restart check; when the next pair is gapped too, that line is
+    # its previous line and is not searched again.
+    matches: dict[int, re.Match[str] | None] = {}
+    matches_line = -1
 
     for i in range(1, len(step_lines)):
         # If the gap between consecutive step lines is small (step lines that
@@ -98,28 +284,36 @@ def detect_step_sequences(text: str, step_patterns: list[str]) -> list[tuple[int
         current_line = step_lines[i]
         prev_line = step_lines[i - 1]
 
-        # Check if the current step restarts numbering
-        current_stripped = lines[current_line].strip()
-        prev_stripped = lines[prev_line].strip()
-
+        # Check if the current step restarts numbering.  A restart only
+        # splits the sequence across a gap, so adjacent step lines (the
+        # common case) skip the check.
         restarts = False
-        for pat in compiled:
-            curr_match = pat.search(current_stripped)
-            prev_match = pat.search(prev_stripped)
-            if curr_match and prev_match:
-                curr_val = curr_match.group(1)
-                prev_val = prev_match.group(1)
-                # If both are numeric and current <= previous, it's a restart
-                if curr_val.isdigit() and prev_val.isdigit():
-                    if int(curr_val) <= int(prev_val) and int(curr_val) == 1:
-                        restarts = True
-                # If both are alpha and current <= previous, it's a restart
-                elif curr_val.isalpha() and prev_val.isalpha():
-                    if curr_val <= prev_val and curr_val == 'a':
-                        restarts = True
-                break
+        if current_line - prev_line > 1:
+            current_stripped = step_stripped[current_line]
+            prev_stripped = step_stripped[prev_line]
+            prev_matches = matches if matches_line == prev_line else {}
+            matches, matches_line = {}, current_line
+
+            for k, pat in enumerate(compiled):
+                curr_match = matches[k] = pat.search(current_stripped)
+                if k in prev_matches:
+                    prev_match = prev_matches[k]
+                else:
+                    prev_match = pat.search(prev_stripped)
+                if curr_match and prev_match:
+                    curr_val = curr_match.group(1)
+                    prev_val = prev_match.group(1)
+                    # If both are numeric and current <= previous, it's a restart
+                    if curr_val.isdigit() and prev_val.isdigit():
+                        if int(curr_val) <= int(prev_val) and int(curr_val) == 1:
+                            restarts = True
+                    # If both are alpha and current <= previous, it's a restart
+                    elif curr_val.isalpha() and prev_val.isalpha():
+                        if curr_val <= prev_val and curr_val == 'a':
+                            restarts = True
+                    break
 
-        if restarts and (current_line - prev_line) > 1:
+        if restarts:
             # End current sequence and start a new one
             sequences.append((seq_start, seq_end))
             seq_start = current_line
@@ -132,6 +326,13 @@ def detect_step_sequences(text: str, step_patterns: list[str]) -> list[tuple[int
     return sequences
 
 
+# A numbered "(1) " or lettered "a. " step, which ends a safety callout.
+# qa.check_split_safety_callouts imports it so both agree on what a step is.
+# One anchored match of this alternation costs less than the equivalent
+# str.find/isdecimal/isspace checks written out in Python.
+_STEP_START_RE = re.compile(r'\(\d+\)\s|[a-z]\.\s')
+
+
 def detect_safety_callouts(
     text: str, profile: ManualProfile
 ) -> list[dict[str, Any]]:
@@ -139,50 +340,129 @@ def detect_safety_callouts(
 
     Returns list of dicts with keys: level, start_line, end_line, text.
     """
-    lines = text.split("\n")
-    callouts: list[dict[str, Any]] = []
+    return list(_iter_safety_callouts(text, profile))
+
+
+def _safety_specs(profile: ManualProfile) -> tuple[tuple[str, int], ...]:
+    """(pattern, flags) for each profile safety callout, in profile order."""
+    return tuple(
+        (sc.pattern, re.IGNORECASE if sc.pattern[0] != "^" else 0)
+        for sc in profile.safety_callouts
+    )
+
+
+def _candidate_safety_indices(
+    text: str, safety_specs: tuple[tuple[str, int], ...]
+) -> list[int]:
+    """Indices of the safety patterns that can match somewhere in *text*.
+
+    Most chunks contain no callout at all.  A case-sensitive pattern whose
+    literal prefix (e.g. "WARNING:") is absent from the text cannot match
+    any line, so it is dropped with one substring search.
+    """
+    candidates = []
+    for sc_idx, (p, flags) in enumerate(safety_specs):
+        literal = _literal_prefix(p) if not flags else ""
+        if not literal or literal in text:
+            candidates.append(sc_idx)
+    return candidates
+
 
-    # Pre-compile all safety callout patterns once for use in the inner loop
-    compiled_safety = [
-        re.compile(sc2.pattern, re.IGNORECASE if sc2.pattern[0] != "^" else 0)
-        for sc2 in profile.safety_callouts
+def _iter_safety_callouts(
+    text: str, profile: ManualProfile
+) -> Iterator[dict[str, Any]]:
+    """Lazily yield the callouts ``detect_safety_callouts`` returns, in order."""
+    # Safety callout patterns, compiled once per process; the union answers
+    # "does this line start any callout" in a single regex call.
+    safety_specs = _safety_specs(profile)
+
+    # When every pattern is ruled out the chunk is never split into lines.
+    candidates = _candidate_safety_indices(text, safety_specs)
+    if not candidates:
+        return
+
+    lines = text.split("\n")
+    # Every callout pattern is tested against the same stripped lines, so
+    # strip each line once up front rather than once per pattern.
+    stripped_lines = [line.strip() for line in lines]
+
+    compiled_safety = [compile_pattern(p, f) for p, f in safety_specs]
+    any_safety = _compile_any(safety_specs)
+
+    # Lines that start a callout of any pattern, found with one union
+    # search per line.  Each pattern is then only tried on these lines, and
+    # the extent scan below looks them up instead of searching again.
+    start_lines = [
+        i
+        for i, stripped in enumerate(stripped_lines)
+        if _any_search(any_safety, compiled_safety, stripped)
     ]
+    callout_starts = set(start_lines)
+    # A callout's extent depends only on its start line, so when several
+    # patterns match the same line it is walked and joined only once.
+    extents: dict[int, tuple[int, str]] = {}
 
-    for sc_idx, sc in enumerate(profile.safety_callouts):
+    for sc_idx in candidates:
+        sc = profile.safety_callouts[sc_idx]
         pat = compiled_safety[sc_idx]
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            if pat.search(stripped):
+        for i in start_lines:
+            if not pat.search(stripped_lines[i]):
+                continue
+            if i in extents:
+                end_line, callout_text = extents[i]
+            else:
                 # Found a callout start. Determine its extent.
                 # The callout continues until the next blank line or
                 # next callout or next structural element.
                 end_line = i
                 for j in range(i + 1, len(lines)):
-                    next_stripped = lines[j].strip()
+                    next_stripped = stripped_lines[j]
                     if not next_stripped:
                         break
                     # Check if this line starts a new callout
-                    is_new_callout = False
-                    for inner_pat in compiled_safety:
-                        if inner_pat.search(next_stripped):
-                            is_new_callout = True
-                            break
-                    if is_new_callout:
+                    if j in callout_starts:
                         break
                     # Check if line starts a numbered step
-                    if re.match(r'^\(\d+\)\s', next_stripped) or re.match(r'^[a-z]\.\s', next_stripped):
+                    if _STEP_START_RE.match(next_stripped):
                         break
                     end_line = j
 
                 callout_text = "\n".join(lines[i:end_line + 1])
-                callouts.append({
-                    "level": sc.level,
-                    "start_line": i,
-                    "end_line": end_line,
-                    "text": callout_text,
-                })
+                extents[i] = end_line, callout_text
+            yield {
+                "level": sc.level,
+                "start_line": i,
+                "end_line": end_line,
+                "text": callout_text,
+            }
+
+
+def _safety_levels(text: str, profile: ManualProfile) -> set[str]:
+    """Levels of the safety callouts in *text*.
+
+    Equivalent to collecting ``level`` over ``detect_safety_callouts`` but
+    stops at the first matching line per pattern, skips patterns whose
+    level is already known, and never builds callout extents or text.
+    """
+    safety_specs = _safety_specs(profile)
+    candidates = _candidate_safety_indices(text, safety_specs)
+    if not candidates:
+        return set()
+
+    stripped_lines = [line.strip() for line in text.split("\n")]
+    levels: set[str] = set()
+    for sc_idx in candidates:
+        level = profile.safety_callouts[sc_idx].level
+        if level in levels:
+            continue
+        pat = compile_pattern(*safety_specs[sc_idx])
+        if any(pat.search(stripped) for stripped in stripped_lines):
+            levels.add(level)
+    return levels
+
 
-    return callouts
+# Three or more dots in a row: the dot leaders of a specification table.
+_DOT_LEADER_RE = re.compile(r'\.{3,}')
 
 
 def detect_tables(text: str) -> list[tuple[int, int]]:
@@ -190,19 +470,24 @@ def detect_tables(text: str) -> list[tuple[int, int]]:
 
     Returns list of (start_line, end_line) tuples.
     """
-    lines = text.split("\n")
-
-    # Detect table-like patterns: dot-leaders, columnar alignment
-    dot_leader_pat = re.compile(r'\.{3,}')  # Three or more dots in a row
-    column_pat = re.compile(r'\s{3,}\S')  # Large whitespace gap suggesting columns
+    # _DOT_LEADER_RE matches exactly where "..." occurs; most chunks have
+    # none, and a substring search rules them out far faster than the regex.
+    if "..." not in text:
+        return []
 
+    # Dot leaders are found with one scan of the whole text and mapped to
+    # line numbers by counting the newlines between matches, so the text is
+    # never split into per-line strings.  (A line with dots is never blank.)
     table_lines: list[int] = []
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-        if not stripped:
-            continue
-        if dot_leader_pat.search(stripped):
-            table_lines.append(i)
+    table_line_offsets: list[int] = []
+    line_no = 0
+    pos = 0
+    for m in _DOT_LEADER_RE.finditer(text):
+        line_no += text.count("\n", pos, m.start())
+        pos = m.start()
+        if not table_lines or table_lines[-1] != line_no:
+            table_lines.append(line_no)
+            table_line_offsets.append(text.rfind("\n", 0, pos) + 1)
 
     if not table_lines:
         return []
@@ -214,8 +499,8 @@ def detect_tables(text: str) -> list[tuple[int, int]]:
 
     # Include a header line if there's one right before the first table line
     if seq_start > 0:
-        prev = lines[seq_start - 1].strip()
-        if prev and not dot_leader_pat.search(prev):
+        prev = _line_before(text, table_line_offsets[0]).strip()
+        if prev and not _DOT_LEADER_RE.search(prev):
             # Could be a table header like "SPECIFICATIONS"
             seq_start = seq_start - 1
 
@@ -229,8 +514,8 @@ def detect_tables(text: str) -> list[tuple[int, int]]:
             seq_start = current
             # Check for header line
             if seq_start > 0:
-                header = lines[seq_start - 1].strip()
-                if header and not dot_leader_pat.search(header):
+                header = _line_before(text, table_line_offsets[i]).strip()
+                if header and not _DOT_LEADER_RE.search(header):
                     seq_start = seq_start - 1
             seq_end = current
 
@@ -238,6 +523,12 @@ def detect_tables(text: str) -> list[tuple[int, int]]:
     return sequences
 
 
+def _line_before(text: str, line_offset: int) -> str:
+    """The line preceding the one that starts at *line_offset* (> 0)."""
+    end = line_offset - 1
+    return text[text.rfind("\n", 0, end) + 1:end]
+
+
 def apply_rule_r1_primary_unit(
     text: str, entry: ManifestEntry
 ) -> list[str]:
@@ -249,69 +540,129 @@ def apply_rule_r1_primary_unit(
     return [text]
 
 
+# A chunk's text paired with its whitespace word count.  The streaming rules
+# from R2 onward pass these along so merged chunks are sized by adding
+# counts instead of re-splitting the merged text.
+_Sized = tuple[str, int]
+
+
+def _sized(chunks: Iterable[str]) -> Iterator[_Sized]:
+    """Pair each chunk with its word count."""
+    for chunk in chunks:
+        yield chunk, len(chunk.split())
+
+
+def _texts(sized: Iterable[_Sized]) -> list[str]:
+    """Drop the word counts from a stream of sized chunks."""
+    return [text for text, _ in sized]
+
+
 def apply_rule_r2_size_targets(chunks: list[str]) -> list[str]:
     """R2: Enforce min 200, target 500-1500, max 2000 token limits."""
-    result: list[str] = []
+    return _texts(_iter_r2_size_targets(chunks))
+
+
+def _iter_r2_size_targets(chunks: Iterable[str]) -> Iterator[_Sized]:
+    """Streaming form of ``apply_rule_r2_size_targets``.
+
+    This is where word counts enter the stream: each chunk is split once
+    here, and only the pieces of an oversized chunk are counted again.
+    """
     max_tokens = 2000
 
     for chunk in chunks:
-        tokens = count_tokens(chunk)
-        if tokens <= max_tokens:
-            result.append(chunk)
+        words = len(chunk.split())
+        if _tokens(words) <= max_tokens:
+            yield chunk, words
         else:
             # Split oversized chunks at paragraph boundaries
-            result.extend(_split_oversized(chunk, max_tokens))
+            yield from _sized(_split_oversized(chunk, max_tokens))
+
 
-    return result
+# A blank (or whitespace-only) line between paragraphs.
+_PARAGRAPH_BREAK_RE = re.compile(r'\n\s*\n')
 
 
 def _split_oversized(text: str, max_tokens: int) -> list[str]:
-    """Split an oversized chunk into pieces that fit within max_tokens."""
+    """Split an oversized chunk into pieces that fit within max_tokens.
+
+    Word counts are additive across whitespace joins, so every paragraph,
+    line and word is counted once and candidate sizes are running sums
+    rather than recounts of the growing candidate text.
+    """
     # Try to split on paragraph boundaries (double newlines)
-    paragraphs = re.split(r'\n\s*\n', text)
+    paragraphs = _PARAGRAPH_BREAK_RE.split(text)
     if len(paragraphs) > 1:
         chunks: list[str] = []
-        current = ""
+        # The chunk being built is kept as its paragraphs and joined with
+        # "\n\n" only when emitted, so growing it never re-copies the text
+        # gathered so far.  An empty paragraph is an empty list.
+        current: list[str] = []
+        current_words = 0
         for para in paragraphs:
-            candidate = (current + "\n\n" + para).strip() if current else para
-            if count_tokens(candidate) <= max_tokens:
-                current = candidate
+            para_words = len(para.split())
+            candidate_words = current_words + para_words if current else para_words
+            if _tokens(candidate_words) <= max_tokens:
+                if current:
+                    current.append(para)
+                    _strip_parts(current)
+                else:
+                    current = [para] if para else []
+                current_words = candidate_words
             else:
                 if current:
-                    chunks.append(current)
+                    chunks.append("\n\n".join(current))
                 # If single paragraph exceeds limit, split further
-                if count_tokens(para) > max_tokens:
+                if _tokens(para_words) > max_tokens:
                     chunks.extend(_split_by_sentences(para, max_tokens))
                 else:
-                    current = para
+                    current = [para] if para else []
+                    current_words = para_words
         if current:
-            chunks.append(current)
+            chunks.append("\n\n".join(current))
         return chunks if chunks else [text]
 
     # No paragraph breaks — split by sentences or lines
     return _split_by_sentences(text, max_tokens)
 
 
+def _strip_parts(parts: list[str]) -> None:
+    """Strip ``"\\n\\n".join(parts)`` in place while keeping it as parts.
+
+    Blank parts at either end vanish together with their separators, and
+    the outermost remaining parts lose their outer whitespace.
+    """
+    while parts and not parts[0].strip():
+        del parts[0]
+    while parts and not parts[-1].strip():
+        parts.pop()
+    if parts:
+        parts[0] = parts[0].lstrip()
+        parts[-1] = parts[-1].rstrip()
+
+
 def _split_by_sentences(text: str, max_tokens: int) -> list[str]:
     """Split text by lines/sentences to fit within max_tokens."""
     lines = text.split("\n")
     chunks: list[str] = []
     current_lines: list[str] = []
+    current_words = 0
 
     for line in lines:
-        candidate = "\n".join(current_lines + [line])
-        if count_tokens(candidate) <= max_tokens:
+        line_words = len(line.split())
+        if _tokens(current_words + line_words) <= max_tokens:
             current_lines.append(line)
+            current_words += line_words
         else:
             if current_lines:
                 chunks.append("\n".join(current_lines))
             # If a single line exceeds the limit, split by words
-            if count_tokens(line) > max_tokens:
+            if _tokens(line_words) > max_tokens:
                 words = line.split()
                 word_chunk: list[str] = []
                 for word in words:
-                    test = " ".join(word_chunk + [word])
-                    if count_tokens(test) <= max_tokens:
+                    # Each word is one whitespace-free token of the joined text
+                    if _tokens(len(word_chunk) + 1) <= max_tokens:
                         word_chunk.append(word)
                     else:
                         if word_chunk:
@@ -321,8 +672,10 @@ def _split_by_sentences(text: str, max_tokens: int) -> list[str]:
                     current_lines = [" ".join(word_chunk)]
                 else:
                     current_lines = []
+                current_words = len(word_chunk)
             else:
                 current_lines = [line]
+                current_words = line_words
 
     if current_lines:
         chunks.append("\n".join(current_lines))
@@ -334,14 +687,18 @@ def apply_rule_r3_never_split_steps(
     text: str, step_patterns: list[str]
 ) -> list[str]:
     """R3: Keep numbered/lettered step sequences in one chunk."""
-    sequences = detect_step_sequences(text, step_patterns)
+    if not _may_contain_steps(text, step_patterns):
+        return [text]
+    # The text is only split into lines once it has a sequence to cut out
+    sequences = _step_sequences(text, step_patterns)
     if not sequences:
         return [text]
-
     lines = text.split("\n")
 
-    # Build protected ranges (inclusive line ranges for step sequences)
-    protected: list[tuple[int, int]] = sorted(sequences)
+    # Protected ranges (inclusive line ranges for step sequences).
+    # detect_step_sequences emits them in line order without overlap, so
+    # one forward walk covers them and no sort or span lookup is needed.
+    protected: list[tuple[int, int]] = sequences
 
     # Build chunks: non-step text before/between/after sequences goes into
     # separate chunks, step sequences each go into their own chunk.
@@ -371,51 +728,71 @@ def apply_rule_r3_never_split_steps(
     return chunks if chunks else [text]
 
 
+def _iter_r3_never_split_steps(
+    chunks: Iterable[str], step_patterns: list[str]
+) -> Iterator[str]:
+    """``apply_rule_r3_never_split_steps`` over each of *chunks* in turn."""
+    # Flattened by chain/map in C rather than a generator frame per chunk
+    return itertools.chain.from_iterable(
+        map(apply_rule_r3_never_split_steps, chunks, itertools.repeat(step_patterns))
+    )
+
+
 def apply_rule_r4_safety_attachment(
     chunks: list[str], profile: ManualProfile
 ) -> list[str]:
     """R4: Safety callouts stay with their governed procedure."""
+    return list(_iter_r4_safety_attachment(chunks, profile))
+
+
+def _iter_r4_safety_attachment(
+    chunks: Iterable[str], profile: ManualProfile
+) -> Iterator[str]:
+    """Streaming form of ``apply_rule_r4_safety_attachment``.
+
+    Holds back one chunk until its successor arrives; the last chunk has
+    nothing to merge into, so it is passed through without being scanned.
+    """
     # For each chunk, ensure safety callouts are kept together with
     # the procedure they govern (which follows the callout).
     # If a chunk ends with a safety callout and next chunk has the procedure,
     # merge them. If a safety callout is in its own chunk, merge with next.
-    result: list[str] = list(chunks)
-
-    # Check if any chunk consists primarily of safety callouts and needs
-    # to be merged with the next chunk (which has the procedure).
-    merged: list[str] = []
-    i = 0
-    while i < len(result):
-        chunk = result[i]
-        callouts = detect_safety_callouts(chunk, profile)
-
-        if callouts and i + 1 < len(result):
-            # Check if there's procedure content after the callout in this chunk
-            # If the chunk is ONLY a safety callout, merge with next
-            lines = chunk.strip().split("\n")
-            non_callout_lines = set(range(len(lines)))
-            for c in callouts:
-                for ln in range(c["start_line"], c["end_line"] + 1):
-                    non_callout_lines.discard(ln)
-
-            # Check if remaining lines have procedure content
-            has_procedure = False
-            for ln in non_callout_lines:
-                if ln < len(lines) and lines[ln].strip():
-                    has_procedure = True
-                    break
+    held: str | None = None
+    for chunk in chunks:
+        if held is None:
+            held = chunk
+            continue
+        if _is_safety_only(held, profile):
+            # Safety-only chunk — merge with next
+            yield held + "\n\n" + chunk
+            held = None
+        else:
+            yield held
+            held = chunk
+
+    if held is not None:
+        yield held
 
-            if not has_procedure:
-                # Safety-only chunk — merge with next
-                merged_text = chunk + "\n\n" + result[i + 1]
-                merged.append(merged_text)
-                i += 2
-                continue
 
-        merged.append(chunk)
-        i += 1
+def _is_safety_only(chunk: str, profile: ManualProfile) -> bool:
+    """Whether *chunk* holds safety callouts and no procedure content."""
+    callouts = detect_safety_callouts(chunk, profile)
+    if not callouts:
+        return False
 
-    return merged
+    # Check if there's procedure content after the callout in this chunk
+    # If the chunk is ONLY a safety callout, merge with next
+    lines = chunk.strip().split("\n")
+    non_callout_lines = set(range(len(lines)))
+    for c in callouts:
+        for ln in range(c["start_line"], c["end_line"] + 1):
+            non_callout_lines.discard(ln)
+
+    # Check if remaining lines have procedure content
+    for ln in non_callout_lines:
+        if ln < len(lines) and lines[ln].strip():
+            return False
+    return True
 
 
 def apply_rule_r5_table_integrity(chunks: list[str]) -> list[str]:
@@ -435,135 +812,169 @@ def apply_rule_r5_table_integrity(chunks: list[str]) -> list[str]:
     result is then re-evaluated on the next iteration so that a table
     split across three chunks is still reassembled.
     """
-    if len(chunks) <= 1:
-        return list(chunks)
-
-    result: list[str] = []
-    i = 0
-    while i < len(chunks):
-        current = chunks[i]
-
-        if i + 1 < len(chunks):
-            next_chunk = chunks[i + 1]
-
-            # Signal 1: current chunk ends with table content
-            current_lines = current.split("\n")
-            current_tables = detect_tables(current)
-            current_ends_with_table = False
-            if current_tables:
-                last_table_end = current_tables[-1][1]
-                # The table's last line is at or very near the end of the chunk
-                # (allow up to 2 trailing blank/whitespace lines)
-                non_blank_end = len(current_lines) - 1
-                while non_blank_end > 0 and not current_lines[non_blank_end].strip():
-                    non_blank_end -= 1
-                if last_table_end >= non_blank_end - 1:
-                    current_ends_with_table = True
-
-            # Signal 2: next chunk starts with table content
-            next_tables = detect_tables(next_chunk)
-            next_starts_with_table = False
-            if next_tables:
-                first_table_start = next_tables[0][0]
-                # The first table starts at or very near the beginning
-                # (allow up to 2 leading blank lines)
-                next_lines = next_chunk.split("\n")
-                first_non_blank = 0
-                while first_non_blank < len(next_lines) and not next_lines[first_non_blank].strip():
-                    first_non_blank += 1
-                if first_table_start <= first_non_blank + 1:
-                    next_starts_with_table = True
-
-            # Only merge when BOTH signals agree
-            if current_ends_with_table and next_starts_with_table:
-                merged = current + "\n" + next_chunk
-                # Replace the next chunk with the merged result so we can
-                # re-evaluate (handles 3-way splits)
-                chunks[i + 1] = merged
-                i += 1
-                continue
+    return list(_iter_r5_table_integrity(chunks))
+
+
+def _iter_r5_table_integrity(chunks: Iterable[str]) -> Iterator[str]:
+    """Streaming form of ``apply_rule_r5_table_integrity``.
+
+    Holds back one chunk so it can be compared with its successor.  Each
+    chunk's table edges are computed once and reused when it moves from
+    the "next" to the "current" position; merged text is never rescanned.
+    """
+    it = iter(chunks)
+    current = next(it, None)
+    if current is None:
+        return
+    current_ends: bool | None = None
+
+    for next_chunk in it:
+        if current_ends is None:
+            current_ends = _table_edges(current)[1]
+        next_starts, next_ends = _table_edges(next_chunk)
+
+        # Only merge when BOTH signals agree: the current chunk ends with
+        # table content and the next chunk starts with table content
+        if current_ends and next_starts:
+            # Keep the merged result as `current` so it is re-evaluated
+            # against the following chunk (handles 3-way splits).  The
+            # next chunk holds table lines, so the merged text's last table
+            # and last non-blank line are both in it: the merged text ends
+            # with a table exactly when the next chunk does.
+            current = current + "\n" + next_chunk
+            current_ends = next_ends
+            continue
+
+        yield current
+        current, current_ends = next_chunk, next_ends
 
-        result.append(current)
-        i += 1
+    yield current
 
-    return result
+
+def _table_edges(text: str) -> tuple[bool, bool]:
+    """Return (starts with table content, ends with table content) for R5."""
+    tables = detect_tables(text)
+    if not tables:
+        return False, False
+
+    # A table means the text is not blank, so its first and last non-blank
+    # lines are the ones holding its first and last non-whitespace
+    # characters; their line numbers are newline counts up to that point.
+
+    # The first table starts at or very near the beginning
+    # (allow up to 2 leading blank lines)
+    first_non_blank = text.count("\n", 0, len(text) - len(text.lstrip()))
+    starts_with_table = tables[0][0] <= first_non_blank + 1
+
+    # The table's last line is at or very near the end of the chunk
+    # (allow up to 2 trailing blank/whitespace lines)
+    non_blank_end = text.count("\n", 0, len(text.rstrip()))
+    ends_with_table = tables[-1][1] >= non_blank_end - 1
+
+    return starts_with_table, ends_with_table
 
 
 def apply_rule_r6_merge_small(chunks: list[str], min_tokens: int = 200) -> list[str]:
     """R6: Merge chunks under min_tokens with next sibling or parent."""
-    if len(chunks) <= 1:
-        return list(chunks)
+    return _texts(_iter_r6_merge_small(_sized(chunks), min_tokens))
+
 
+def _iter_r6_merge_small(
+    chunks: Iterable[_Sized], min_tokens: int = 200
+) -> Iterator[_Sized]:
+    """Streaming form of ``apply_rule_r6_merge_small``."""
     # Use a merge threshold: only merge truly small chunks (well below min_tokens).
     # Chunks that are at or near half the min_tokens threshold are considered
     # substantive enough to stand alone.
     merge_threshold = min_tokens // 2
 
-    result: list[str] = []
-    i = 0
-    while i < len(chunks):
-        current = chunks[i]
-        if count_tokens(current) < merge_threshold and i + 1 < len(chunks):
-            # Merge with next chunk and re-evaluate the merged result
-            # by keeping it as `current` for the next iteration
-            chunks[i + 1] = current + "\n\n" + chunks[i + 1]
-            i += 1
-        else:
-            result.append(current)
-            i += 1
+    # Word counts are additive across a whitespace join, so merged results
+    # are sized without recounting.  A run of small chunks is collected as
+    # parts and joined once when it is emitted, rather than re-copying the
+    # growing prefix on every merge.
+    carry: list[str] = []
+    carry_words = 0
+    for chunk, words in chunks:
+        # A small predecessor is prepended and the merged result
+        # re-evaluated in its place
+        carry.append(chunk)
+        carry_words += words
+        if _tokens(carry_words) < merge_threshold:
+            continue
+        yield "\n\n".join(carry), carry_words
+        carry = []
+        carry_words = 0
 
-    return result
+    # A small final chunk has no next sibling and stands alone
+    if carry:
+        yield "\n\n".join(carry), carry_words
 
 
 def apply_rule_r7_crossref_merge(
     chunks: list[str], cross_ref_patterns: list[str]
 ) -> list[str]:
     """R7: Cross-ref-only sections merge into parent."""
-    compiled = [re.compile(p) for p in cross_ref_patterns]
-
-    result: list[str] = []
-    i = 0
-    while i < len(chunks):
-        chunk = chunks[i]
-
-        # Check if this chunk consists only of cross-references
-        if _is_crossref_only(chunk, compiled):
-            if result:
-                # Merge into previous (parent) chunk
-                result[-1] = result[-1] + "\n\n" + chunk
-            else:
-                # No parent to merge into — keep as is
-                result.append(chunk)
-        else:
-            result.append(chunk)
-        i += 1
+    return _texts(_iter_r7_crossref_merge(_sized(chunks), cross_ref_patterns))
 
-    return result
 
+def _iter_r7_crossref_merge(
+    chunks: Iterable[_Sized], cross_ref_patterns: list[str]
+) -> Iterator[_Sized]:
+    """Streaming form of ``apply_rule_r7_crossref_merge``.
 
-def _is_crossref_only(text: str, compiled_patterns: list[re.Pattern]) -> bool:
-    """Check if a chunk consists only of cross-references and headers."""
-    lines = text.strip().split("\n")
-    if not lines:
-        return False
+    The last kept chunk is held back until a chunk arrives that will not
+    merge into it.
+    """
+    compiled = [compile_pattern(p) for p in cross_ref_patterns]
+    any_xref = _compile_any(tuple((p, 0) for p in cross_ref_patterns))
+
+    # The parent and the cross-ref chunks merged into it are kept as parts
+    # and joined once, when the parent is emitted.
+    parent: list[str] = []
+    parent_words = 0
+    for chunk, words in chunks:
+        # Check if this chunk consists only of cross-references; with no
+        # parent to merge into it is kept as is
+        if parent and _is_crossref_only(chunk, compiled, any_xref):
+            # Merge into previous (parent) chunk
+            parent.append(chunk)
+            parent_words += words
+            continue
+        if parent:
+            yield "\n\n".join(parent), parent_words
+        parent = [chunk]
+        parent_words = words
 
-    for line in lines:
+    if parent:
+        yield "\n\n".join(parent), parent_words
+
+
+def _is_crossref_only(
+    text: str,
+    compiled_patterns: list[re.Pattern],
+    any_pattern: re.Pattern[str] | None = None,
+) -> bool:
+    """Check if a chunk consists only of cross-references and headers.
+
+    *any_pattern* is an optional union of *compiled_patterns* (see
+    ``_compile_any``) used to test each line with one regex call.
+    """
+    # Blank lines are skipped below, so the text needs no strip() copy,
+    # and the first content line that is neither a heading nor a
+    # cross-reference ends the scan.
+    for line in text.split("\n"):
         stripped = line.strip()
         if not stripped:
             continue
 
-        # Check if the line is a cross-reference
-        is_crossref = False
-        for pat in compiled_patterns:
-            if pat.search(stripped):
-                is_crossref = True
-                break
-
-        if is_crossref:
+        # Check if the line looks like a heading (all caps, short); with
+        # maxsplit=5 there are 6 items exactly when the line has > 5 words.
+        # Tried first, so a heading line is accepted without a regex call.
+        if stripped.isupper() and len(stripped.split(None, 5)) <= 5:
             continue
 
-        # Check if the line looks like a heading (all caps, short)
-        if stripped.isupper() and len(stripped.split()) <= 5:
+        # Check if the line is a cross-reference
+        if _any_search(any_pattern, compiled_patterns, stripped):
             continue
 
         # This line has real content that isn't a cross-ref or heading
@@ -588,51 +999,64 @@ def apply_rule_r8_figure_continuity(
     * The previous chunk must also contain a match for the same pattern
       (confirming the figure is discussed there, not somewhere unrelated).
     """
-    pat = re.compile(figure_pattern)
-
-    result: list[str] = []
-    i = 0
-    while i < len(chunks):
-        chunk = chunks[i]
-
-        if result:
-            # Check if this chunk starts with a figure reference line
-            lines = chunk.split("\n")
-            first_non_blank_idx = 0
-            while first_non_blank_idx < len(lines) and not lines[first_non_blank_idx].strip():
-                first_non_blank_idx += 1
-
-            if first_non_blank_idx < len(lines):
-                first_line = lines[first_non_blank_idx].strip()
-                first_match = pat.search(first_line)
-
-                if first_match:
-                    # Extract the figure identifier from the first line
-                    fig_id = first_match.group(1) if first_match.lastindex else first_match.group(0)
-
-                    # Check if the previous chunk references the same figure
-                    prev_chunk = result[-1]
-                    prev_has_same_fig = False
-                    for prev_match_obj in pat.finditer(prev_chunk):
-                        prev_fig_id = (
-                            prev_match_obj.group(1)
-                            if prev_match_obj.lastindex
-                            else prev_match_obj.group(0)
-                        )
-                        if prev_fig_id == fig_id:
-                            prev_has_same_fig = True
-                            break
-
-                    if prev_has_same_fig:
-                        # Merge this chunk into the previous one
-                        result[-1] = prev_chunk + "\n\n" + chunk
-                        i += 1
-                        continue
+    return _texts(_iter_r8_figure_continuity(_sized(chunks), figure_pattern))
+
+
+def _iter_r8_figure_continuity(
+    chunks: Iterable[_Sized], figure_pattern: str
+) -> Iterator[_Sized]:
+    """Streaming form of ``apply_rule_r8_figure_continuity``."""
+    pat = compile_pattern(figure_pattern)
+
+    prev_chunk: str | None = None
+    prev_words = 0
+    for chunk, words in chunks:
+        if prev_chunk is not None and _continues_figure(chunk, prev_chunk, pat):
+            # Merge this chunk into the previous one
+            prev_chunk = prev_chunk + "\n\n" + chunk
+            prev_words += words
+            continue
+        if prev_chunk is not None:
+            yield prev_chunk, prev_words
+        prev_chunk, prev_words = chunk, words
+
+    if prev_chunk is not None:
+        yield prev_chunk, prev_words
 
-        result.append(chunk)
-        i += 1
 
-    return result
+def _continues_figure(chunk: str, prev_chunk: str, pat: re.Pattern[str]) -> bool:
+    """Whether *chunk* opens with a figure line that *prev_chunk* also references."""
+    # Check if this chunk starts with a figure reference line.  The first
+    # non-blank line is located by offset so the chunk is not split whole.
+    content_start = len(chunk) - len(chunk.lstrip())
+    if content_start == len(chunk):
+        return False
+    line_start = chunk.rfind("\n", 0, content_start) + 1
+    line_end = chunk.find("\n", content_start)
+    first_line = chunk[line_start:line_end if line_end >= 0 else None].strip()
+    first_match = pat.search(first_line)
+    if not first_match:
+        return False
+
+    # Extract the figure identifier from the first line
+    fig_id = first_match.group(1) if first_match.lastindex else first_match.group(0)
+
+    # Check if the previous chunk references the same figure.  Any such
+    # reference contains fig_id as a substring, so a plain substring
+    # search rules most chunks out before the regex rescans prev_chunk.
+    # (fig_id is None when group 1 exists but took no part in the match;
+    # only the regex scan can compare that.)
+    if isinstance(fig_id, str) and fig_id not in prev_chunk:
+        return False
+    for prev_match_obj in pat.finditer(prev_chunk):
+        prev_fig_id = (
+            prev_match_obj.group(1)
+            if prev_match_obj.lastindex
+            else prev_match_obj.group(0)
+        )
+        if prev_fig_id == fig_id:
+            return True
+    return False
 
 
 def _extract_level1_id(chunk: Chunk) -> str:
@@ -642,7 +1066,7 @@ def _extract_level1_id(chunk: Chunk) -> str:
     Returns the second ``::``-delimited segment, or an empty string if
     the chunk_id has fewer than two segments.
     """
-    parts = chunk.chunk_id.split("::")
+    parts = chunk.chunk_id.split("::", 2)
     if len(parts) >= 2:
         return parts[1]
     return ""
@@ -663,51 +1087,92 @@ def merge_small_across_entries(
 
     Returns a new list — the input list is not mutated.
     """
+    words = [len(c.text.split()) for c in chunks]
+    return _merge_small_across_entries(chunks, words, min_tokens, max_tokens)[0]
+
+
+def _merge_small_across_entries(
+    chunks: list[Chunk], words: list[int], min_tokens: int = 200, max_tokens: int = 2000
+) -> tuple[list[Chunk], list[int]]:
+    """``merge_small_across_entries`` given each chunk's word count.
+
+    *words* runs parallel to *chunks* and is consumed (updated in place).
+    Alongside the merged chunks, returns for each one the index in *chunks*
+    of the chunk whose id and metadata it kept.
+    """
     # Threshold tuning: min_tokens=200 catches most tiny chunks,
     # max_tokens=2000 prevents oversized merged chunks.
     # Tuned against XJ 1999 service manual output.
     if not chunks:
-        return []
-
-    working = list(chunks)
+        return [], []
+
+    # The merge works on parallel lists rather than Chunk objects: texts,
+    # word counts (summed on merge, so no text is split again here), the
+    # index of the input chunk whose id and metadata each entry keeps, and
+    # its level-1 id (extracted once).  Chunks are built only at the end.
+    texts = [c.text for c in chunks]
+    origins = list(range(len(chunks)))
+    level1_ids = [_extract_level1_id(c) for c in chunks]
     max_passes = 10
 
     for pass_num in range(max_passes):
-        before = len(working)
-        merged: list[Chunk] = []
+        before = len(texts)
+        merged_texts: list[str] = []
+        merged_words: list[int] = []
+        merged_origins: list[int] = []
+        merged_level1_ids: list[str] = []
+        # Texts prepended to texts[i] by merges earlier in this pass,
+        # joined once when the merged chunk is emitted.
+        pending: list[str] = []
         i = 0
-        while i < len(working):
-            current = working[i]
-
-            if count_tokens(current.text) < min_tokens and i + 1 < len(working):
-                next_chunk = working[i + 1]
-                current_l1 = _extract_level1_id(current)
-                next_l1 = _extract_level1_id(next_chunk)
+        while i < len(texts):
+            text = texts[i]
 
-                if current_l1 == next_l1:
-                    combined_text = current.text + "\n\n" + next_chunk.text
+            if _tokens(words[i]) < min_tokens and i + 1 < len(texts):
+                if level1_ids[i] == level1_ids[i + 1]:
+                    combined_words = words[i] + words[i + 1]
                     # Guard: don't merge if the result would exceed max_tokens
-                    if count_tokens(combined_text) <= max_tokens:
+                    if _tokens(combined_words) <= max_tokens:
                         # Prepend current text to next chunk; next chunk keeps its metadata
-                        working[i + 1] = Chunk(
-                            chunk_id=next_chunk.chunk_id,
-                            manual_id=next_chunk.manual_id,
-                            text=combined_text,
-                            metadata=next_chunk.metadata,
-                        )
+                        pending.append(text)
+                        words[i + 1] = combined_words
                         i += 1
                         continue
 
-            merged.append(current)
+            if pending:
+                pending.append(text)
+                text = "\n\n".join(pending)
+                pending = []
+            merged_texts.append(text)
+            merged_words.append(words[i])
+            merged_origins.append(origins[i])
+            merged_level1_ids.append(level1_ids[i])
             i += 1
 
-        working = merged
-        after = len(working)
+        texts = merged_texts
+        words = merged_words
+        origins = merged_origins
+        level1_ids = merged_level1_ids
+        after = len(texts)
         if after == before:
             break  # Stable — no merges occurred this pass
 
+    # Unmerged chunks are returned as they are; a merged text gets a new
+    # chunk carrying the id and metadata of the chunk it kept.
+    working: list[Chunk] = []
+    for text, idx in zip(texts, origins):
+        chunk = chunks[idx]
+        if text is not chunk.text:
+            chunk = Chunk(
+                chunk_id=chunk.chunk_id,
+                manual_id=chunk.manual_id,
+                text=text,
+                metadata=chunk.metadata,
+            )
+        working.append(chunk)
+
     logger.debug("Cross-entry merge: %d → %d chunks", len(chunks), len(working))
-    return working
+    return working, origins
 
 
 def enrich_chunk_metadata(
@@ -730,27 +1195,118 @@ def enrich_chunk_metadata(
     manifest entry boundaries.
     """
     # -- Safety callouts ------------------------------------------------
-    callouts = detect_safety_callouts(text, profile)
-    levels = sorted({c["level"] for c in callouts})
+    levels = sorted(_safety_levels(text, profile))
     metadata["has_safety_callouts"] = levels
 
     # -- Figure references ----------------------------------------------
     if profile.figure_reference_pattern:
-        fig_matches = re.findall(profile.figure_reference_pattern, text)
+        fig_matches = compile_pattern(profile.figure_reference_pattern).findall(text)
         metadata["figure_references"] = sorted(set(fig_matches))
     else:
         metadata["figure_references"] = []
 
     # -- Cross-references -----------------------------------------------
-    xref_matches: list[str] = []
+    xref_matches: set[str] = set()
     for pat in profile.cross_reference_patterns:
-        xref_matches.extend(re.findall(pat, text))
+        xref_matches.update(compile_pattern(pat).findall(text))
     # Qualify cross-references with manual_id namespace prefix so they
     # resolve against chunk IDs (which are "{manual_id}::{group}::...").
     manual_id = metadata.get("manual_id", "")
     if manual_id:
-        xref_matches = [f"{manual_id}::{ref}" for ref in xref_matches]
-    metadata["cross_references"] = sorted(set(xref_matches))
+        xref_matches = {f"{manual_id}::{ref}" for ref in xref_matches}
+    metadata["cross_references"] = sorted(xref_matches)
+
+
+# (output label, ((name, name.lower()), ...)) -- one entry per vehicle model,
+# engine or drive type in profile order; the label is reported when any of
+# its names occurs in the chunk text.
+_ApplicabilityEntries = tuple[tuple[str, tuple[tuple[str, str], ...]], ...]
+
+
+@dataclass(frozen=True)
+class _ApplicabilityVocabulary:
+    """Vehicle/engine/drivetrain vocabulary of a profile, prepared once.
+
+    The same alias (e.g. an engine shared by several vehicles) appears many
+    times across a profile; ``terms`` holds each distinct lowercase string
+    once so a chunk is searched for it only once.
+
+    ``exact_names`` lists the few names that still need a case-sensitive
+    search.  ``str.lower`` maps every character independently except
+    capital sigma, which lowers to final or medial sigma depending on its
+    neighbours; so for any other name, finding it in the text implies its
+    lowercase form is in the lowered text, and the exact search can only
+    succeed for names containing a capital sigma.  Each is paired with its
+    lowercase form so that is not recomputed per chunk.
+    """
+    models: _ApplicabilityEntries
+    engines: _ApplicabilityEntries
+    drivetrains: _ApplicabilityEntries
+    terms: frozenset[str]
+    exact_names: tuple[tuple[str, str], ...]
+
+
+@functools.lru_cache(maxsize=32)
+def _build_applicability_vocabulary(
+    vehicles: tuple[tuple[str, tuple[str, ...], tuple[tuple[str, ...], ...]], ...]
+) -> _ApplicabilityVocabulary:
+    def entry(label: str, names: tuple[str, ...]) -> tuple[str, tuple[tuple[str, str], ...]]:
+        return label, tuple((name, name.lower()) for name in names)
+
+    models = tuple(entry(model, (model,)) for model, _, _ in vehicles)
+    engines = tuple(
+        entry(names[0], names) for _, _, engine_names in vehicles for names in engine_names
+    )
+    drivetrains = tuple(
+        entry(dt, (dt,)) for _, drive_types, _ in vehicles for dt in drive_types
+    )
+    all_names = {
+        name for _, pairs in models + engines + drivetrains for name, _ in pairs
+    }
+    return _ApplicabilityVocabulary(
+        models=models,
+        engines=engines,
+        drivetrains=drivetrains,
+        terms=frozenset(name.lower() for name in all_names),
+        exact_names=tuple(
+            (name, name.lower()) for name in all_names if "\u03a3" in name
+        ),
+    )
+
+
+def _applicability_vocabulary(profile: ManualProfile) -> _ApplicabilityVocabulary:
+    """Cached vocabulary for *profile*, keyed on a hashable snapshot of its vehicles."""
+    return _build_applicability_vocabulary(tuple(
+        (
+            vehicle.model,
+            tuple(vehicle.drive_type),
+            tuple(
+                (engine.name, engine.code, *engine.aliases)
+                for engine in vehicle.engines
+            ),
+        )
+        for vehicle in profile.vehicles
+    ))
+
+
+def _matched_labels(
+    entries: _ApplicabilityEntries,
+    present: frozenset[str],
+    present_exact: frozenset[str],
+) -> list[str]:
+    # Labels are reported in profile order; the set only answers "already
+    # tagged?" so an engine listed under many vehicles is not rescanned.
+    labels: list[str] = []
+    seen: set[str] = set()
+    for label, names in entries:
+        if label in seen:
+            continue
+        for name, lowered in names:
+            if lowered in present or name in present_exact:
+                labels.append(label)
+                seen.add(label)
+                break
+    return labels
 
 
 def tag_vehicle_applicability(
@@ -760,76 +1316,283 @@ def tag_vehicle_applicability(
 
     Returns dict with keys: vehicle_models, engine_applicability, drivetrain_applicability.
     """
-    vehicle_models: list[str] = []
-    engine_applicability: list[str] = []
-    drivetrain_applicability: list[str] = []
-
-    text_lower = text.lower()
-
-    # Check vehicle models
-    for vehicle in profile.vehicles:
-        model = vehicle.model
-        if model.lower() in text_lower or model in text:
-            if model not in vehicle_models:
-                vehicle_models.append(model)
-
-    # Check engines
-    for vehicle in profile.vehicles:
-        for engine in vehicle.engines:
-            # Check engine name and aliases
-            names_to_check = [engine.name, engine.code] + engine.aliases
-            for name in names_to_check:
-                if name.lower() in text_lower or name in text:
-                    entry = engine.name
-                    if entry not in engine_applicability:
-                        engine_applicability.append(entry)
-                    break
+    return _tag_applicability_batch([text], _applicability_vocabulary(profile))[0]
+
+
+# Joins the lowercased texts for _tag_applicability_batch; a control
+# character that never occurs in a vehicle, engine or drive type name.
+_TAG_SEPARATOR = "\x1f"
+
+
+def _tag_applicability_batch(
+    texts: list[str], vocab: _ApplicabilityVocabulary
+) -> list[dict[str, list[str]]]:
+    """``tag_vehicle_applicability`` for each of *texts*, given the profile's vocabulary.
+
+    Each text is lowercased once and the results are joined, so every
+    distinct term is located across all texts by one ``str.find`` walk
+    instead of one substring search per text.  A hit is attributed to its
+    text by offset and the walk resumes at the next text, so a term that
+    recurs within one text costs a single hit.
+    """
+    # A single re.IGNORECASE alternation would avoid the lowercase copies
+    # but is several times slower, and finditer's non-overlapping matches
+    # would drop names nested in longer ones ("CJ-5" in "CJ-5A").
+    lowered = [text.lower() for text in texts]
+    joined = _TAG_SEPARATOR.join(lowered)
+    # bounds[k] is where text k+1 starts in joined, one past text k's separator
+    bounds = list(itertools.accumulate(len(low) + 1 for low in lowered))
+
+    present: dict[int, set[str]] = {}
+    for term in vocab.terms:
+        if not term or _TAG_SEPARATOR in term:
+            # Could match across the separator: test each text on its own
+            for k, low in enumerate(lowered):
+                if term in low:
+                    present.setdefault(k, set()).add(term)
+            continue
+        i = joined.find(term)
+        while i >= 0:
+            k = bisect.bisect_right(bounds, i)
+            present.setdefault(k, set()).add(term)
+            i = joined.find(term, bounds[k])
+    del lowered, joined
+
+    # Most texts mention no vehicle at all and the rest repeat a handful of
+    # combinations, so the labels are derived once per distinct set of hits.
+    labels_for: dict[
+        tuple[frozenset[str], frozenset[str]], tuple[list[str], list[str], list[str]]
+    ] = {}
+    no_hits: frozenset[str] = frozenset()
+    tags: list[dict[str, list[str]]] = []
+    for k, text in enumerate(texts):
+        hits = frozenset(present[k]) if k in present else no_hits
+        # The only names a case-sensitive search could still find (see
+        # exact_names) are tried in their original form if their lowercase
+        # form was not found.
+        exact_hits = frozenset(
+            name for name, low in vocab.exact_names if low not in hits and name in text
+        ) if vocab.exact_names else no_hits
+        key = (hits, exact_hits)
+        labels = labels_for.get(key)
+        if labels is None:
+            # Default to ["all"] if nothing specific was found
+            labels = labels_for[key] = (
+                _matched_labels(vocab.models, hits, exact_hits) or ["all"],
+                _matched_labels(vocab.engines, hits, exact_hits) or ["all"],
+                _matched_labels(vocab.drivetrains, hits, exact_hits) or ["all"],
+            )
+        vehicle_models, engine_applicability, drivetrain_applicability = labels
+        # Each text gets its own lists, as if it had been tagged alone
+        tags.append({
+            "vehicle_models": list(vehicle_models),
+            "engine_applicability": list(engine_applicability),
+            "drivetrain_applicability": list(drivetrain_applicability),
+        })
+    return tags
+
+
+def _apply_rules_fused(chunks: list[str], profile: ManualProfile) -> list[_Sized]:
+    """Apply R3, R4, R5, R2, R6, R7 and R8 (in that order) in a single sweep.
+
+    Each rule is a generator that holds back at most one chunk, so the
+    chain streams every chunk through all seven rules without building an
+    intermediate list per rule.  The texts are identical to calling the
+    ``apply_rule_*`` functions one after another (R3 on each chunk in
+    turn); each comes paired with its word count, which R2 computes and
+    the merging rules add up.
+    """
+    # R3 and R4 pass every chunk through unchanged when the profile has no
+    # step patterns or no safety callouts, so they are left out of the chain
+    # (as R8 is without a figure pattern).  R7 always runs: with no
+    # cross-reference patterns it still merges heading-only chunks.
+    texts: Iterable[str] = chunks
+    # R3: Never split steps
+    if profile.step_patterns:
+        texts = _iter_r3_never_split_steps(texts, profile.step_patterns)
+    # R4: Safety callout attachment
+    if profile.safety_callouts:
+        texts = _iter_r4_safety_attachment(texts, profile)
+    # R5: Table integrity
+    texts = _iter_r5_table_integrity(texts)
+    # R2: Size targets (split oversized)
+    sized = _iter_r2_size_targets(texts)
+    # R6: Merge small chunks
+    sized = _iter_r6_merge_small(sized)
+    # R7: Cross-reference merge
+    sized = _iter_r7_crossref_merge(sized, profile.cross_reference_patterns)
+    # R8: Figure continuity
+    if profile.figure_reference_pattern:
+        sized = _iter_r8_figure_continuity(sized, profile.figure_reference_pattern)
+    return list(sized)
+
 
-    # Check drivetrains
-    for vehicle in profile.vehicles:
-        for dt in vehicle.drive_type:
-            if dt.lower() in text_lower or dt in text:
-                if dt not in drivetrain_applicability:
-                    drivetrain_applicability.append(dt)
-
-    # Default to ["all"] if nothing specific was found
-    if not vehicle_models:
-        vehicle_models = ["all"]
-    if not engine_applicability:
-        engine_applicability = ["all"]
-    if not drivetrain_applicability:
-        drivetrain_applicability = ["all"]
-
-    return {
-        "vehicle_models": vehicle_models,
-        "engine_applicability": engine_applicability,
-        "drivetrain_applicability": drivetrain_applicability,
+def _assemble_entry(
+    text: str,
+    entry: ManifestEntry,
+    manual_id: str,
+    profile: ManualProfile,
+    tags: dict[str, list[str]],
+) -> list[tuple[Chunk, int]]:
+    """Apply R1-R8 to one manifest entry's text and build its chunks.
+
+    *tags* is the entry's vehicle applicability, which the caller tags
+    for all entries in one batch (see ``_tag_applicability_batch``).
+
+    Each chunk is returned with its word count for the cross-entry merge.
+    Per-chunk metadata is not enriched yet: ``assemble_chunks`` does that
+    only for the chunks that survive the merge.
+    """
+    # ── Rule Application Order ──────────────────────────────────
+    # Intentionally non-sequential. Rules execute in two phases:
+    #
+    # Phase 1 — Semantic integrity (before any size enforcement):
+    #   R1: Primary unit — establish procedure boundaries
+    #   R3: Never split steps — protect step sequences as atomic
+    #   R4: Safety attachment — bind callouts to parent content
+    #   R5: Table integrity — keep tables with their headers
+    #
+    # Phase 2 — Size enforcement and cleanup:
+    #   R2: Size targets — split oversized chunks (AFTER integrity
+    #       rules so it respects step/safety/table boundaries)
+    #   R6: Merge small — combine undersized fragments
+    #   R7: Cross-reference merge — consolidate xref-only sections
+    #   R8: Figure continuity — keep figure refs with context
+    #
+    # WHY: If R2 ran before R3-R5, it would split at token
+    # boundaries before semantic units are identified, breaking
+    # step sequences, safety callouts, and tables across chunks.
+    # See LEARNINGS.md for discovery context.
+    # ────────────────────────────────────────────────────────────
+
+    # R1: Primary unit — one procedure per chunk
+    text_chunks = apply_rule_r1_primary_unit(text, entry)
+
+    # R3, R4, R5, R2, R6, R7, R8 in one fused left-to-right sweep
+    sized_chunks = _apply_rules_fused(text_chunks, profile)
+
+    # Build hierarchical header
+    header = compose_hierarchical_header(profile, entry.hierarchy_path)
+
+    # Extract level1_id from hierarchy_path or chunk_id.
+    # hierarchy_path[0] is the level-1 title (e.g. "0 Lubrication and Maintenance").
+    # For the ID we parse the chunk_id: "{manual_id}::{level1_id}::..."
+    # Interned so every chunk of a level-1 group shares one string.
+    level1_id = ""
+    chunk_id_parts = entry.chunk_id.split("::")
+    if len(chunk_id_parts) >= 2:
+        level1_id = sys.intern(chunk_id_parts[1])
+
+    # Entry-level metadata, built once and shared by reference across
+    # the entry's chunks; each chunk gets a shallow copy that
+    # enrich_chunk_metadata then overrides with its per-chunk keys.
+    entry_metadata = {
+        "manual_id": manual_id,
+        "level1_id": level1_id,
+        "procedure_name": entry.title,
+        "hierarchical_header": header,
+        "hierarchy_path": entry.hierarchy_path,
+        "content_type": entry.content_type,
+        "page_range": {"start": entry.page_range.start, "end": entry.page_range.end},
+        "vehicle_models": tags["vehicle_models"],
+        "engine_applicability": tags["engine_applicability"],
+        "drivetrain_applicability": tags["drivetrain_applicability"],
+        "has_safety_callouts": entry.has_safety_callouts,
+        "figure_references": entry.figure_references,
+        "cross_references": entry.cross_references,
     }
 
+    # Build Chunk objects
+    # Chunk ids are settled per entry: the common single-chunk entry
+    # reuses the entry's id, otherwise the "::part" prefix is built once.
+    if len(sized_chunks) == 1:
+        chunk_ids = [sys.intern(entry.chunk_id)]
+    else:
+        part_prefix = f"{entry.chunk_id}::part"
+        chunk_ids = [
+            sys.intern(f"{part_prefix}{n}") for n in range(1, len(sized_chunks) + 1)
+        ]
+
+    chunks: list[tuple[Chunk, int]] = []
+    for chunk_id, (chunk_text, words) in zip(chunk_ids, sized_chunks):
+        metadata = dict(entry_metadata)
+
+        chunks.append((
+            Chunk(
+                chunk_id=chunk_id,
+                manual_id=manual_id,
+                text=chunk_text,
+                metadata=metadata,
+            ),
+            words,
+        ))
+
+    return chunks
+
+
+_worker_profile: ManualProfile | None = None
+_worker_manual_id = ""
+
+
+def _init_worker(profile: ManualProfile, manual_id: str) -> None:
+    global _worker_profile, _worker_manual_id
+    _worker_profile = profile
+    _worker_manual_id = manual_id
+
+
+def _assemble_entry_job(
+    job: tuple[str, ManifestEntry, dict[str, list[str]]]
+) -> list[tuple[Chunk, int]]:
+    text, entry, tags = job
+    return _assemble_entry(text, entry, _worker_manual_id, _worker_profile, tags)
+
 
 def assemble_chunks(
-    pages: list[str], manifest: Manifest, profile: ManualProfile
+    pages: list[str],
+    manifest: Manifest,
+    profile: ManualProfile,
+    workers: int | None = 1,
 ) -> list[Chunk]:
     """Run the full chunk assembly pipeline.
 
     Applies rules R1-R8 in non-sequential order (R1,R3,R4,R5,R2,R6,R7,R8)
-    to ensure semantic integrity before size enforcement. See the inline
-    comment block above the rule applications for the full rationale.
+    to ensure semantic integrity before size enforcement. See the comment
+    block in ``_assemble_entry`` for the full rationale.
+
+    Rules R1-R8 only ever see one manifest entry's text, so entries are
+    independent.  With *workers* > 1 (or ``None`` for one per CPU) they
+    are assembled in a process pool; results come back in manifest order
+    and the cross-entry merge then runs in this process, so the output is
+    identical to the default in-process run.  *workers* of 0 is treated
+    like ``None``; a negative count raises ``ValueError``.  Callers using
+    workers must run under an ``if __name__ == "__main__"`` guard (spawn
+    start method).
     """
+    if workers is not None and workers < 1:
+        if workers < 0:
+            raise ValueError(f"workers must be >= 0 or None, got {workers}")
+        workers = None
     all_text = "\n".join(pages)
-    lines = all_text.split("\n")
-    total_lines = len(lines)
+    # Offset in all_text where each line starts, plus one past the end, so
+    # an entry's lines are one slice of all_text rather than a joined list.
+    # all_text's lines are exactly the lines of its pages, so the offsets
+    # are accumulated page by page and the whole manual is never split.
+    line_starts = array("q", [0])
+    line_starts.extend(itertools.accumulate(
+        len(line) + 1 for page in pages for line in page.split("\n")
+    ))
+    total_lines = len(line_starts) - 1
     logger.debug("Assembling chunks from %d manifest entries, %d total lines", len(manifest.entries), total_lines)
 
-    result_chunks: list[Chunk] = []
-
-    # Build skip prefixes from profile.skip_sections
-    manual_id = manifest.manual_id
-    skip_prefixes = [f"{manual_id}::{s}" for s in profile.skip_sections]
+    # Build skip prefixes from profile.skip_sections; as a tuple they are
+    # all tested by one str.startswith call
+    manual_id = sys.intern(manifest.manual_id)
+    skip_prefixes = tuple(f"{manual_id}::{s}" for s in profile.skip_sections)
 
+    jobs: list[tuple[str, ManifestEntry]] = []
     for entry_idx, entry in enumerate(manifest.entries):
         # Skip entries whose chunk_id matches a skipped section prefix
-        if skip_prefixes and any(entry.chunk_id.startswith(p) for p in skip_prefixes):
+        if skip_prefixes and entry.chunk_id.startswith(skip_prefixes):
             logger.debug("Skipping entry %s (matches skip_sections)", entry.chunk_id)
             continue
         # Extract text for this manifest entry based on line range
@@ -840,137 +1603,75 @@ def assemble_chunks(
             end_line = next_entry.line_range.start
         else:
             end_line = total_lines
+        end_line = min(end_line, total_lines)
 
-        if start_line >= total_lines:
+        if start_line >= end_line:
             continue
 
-        text = "\n".join(lines[start_line:end_line]).strip()
+        text = all_text[line_starts[start_line]:line_starts[end_line] - 1].strip()
         if not text:
             continue
-
-        # ── Rule Application Order ──────────────────────────────────
-        # Intentionally non-sequential. Rules execute in two phases:
-        #
-        # Phase 1 — Semantic integrity (before any size enforcement):
-        #   R1: Primary unit — establish procedure boundaries
-        #   R3: Never split steps — protect step sequences as atomic
-        #   R4: Safety attachment — bind callouts to parent content
-        #   R5: Table integrity — keep tables with their headers
-        #
-        # Phase 2 — Size enforcement and cleanup:
-        #   R2: Size targets — split oversized chunks (AFTER integrity
-        #       rules so it respects step/safety/table boundaries)
-        #   R6: Merge small — combine undersized fragments
-        #   R7: Cross-reference merge — consolidate xref-only sections
-        #   R8: Figure continuity — keep figure refs with context
-        #
-        # WHY: If R2 ran before R3-R5, it would split at token
-        # boundaries before semantic units are identified, breaking
-        # step sequences, safety callouts, and tables across chunks.
-        # See LEARNINGS.md for discovery context.
-        # ────────────────────────────────────────────────────────────
-
-        # R1: Primary unit — one procedure per chunk
-        text_chunks = apply_rule_r1_primary_unit(text, entry)
-
-        # R3: Never split steps
-        expanded: list[str] = []
-        for tc in text_chunks:
-            expanded.extend(
-                apply_rule_r3_never_split_steps(tc, profile.step_patterns)
-            )
-        text_chunks = expanded
-
-        # R4: Safety callout attachment
-        text_chunks = apply_rule_r4_safety_attachment(text_chunks, profile)
-
-        # R5: Table integrity
-        text_chunks = apply_rule_r5_table_integrity(text_chunks)
-
-        # R2: Size targets (split oversized)
-        text_chunks = apply_rule_r2_size_targets(text_chunks)
-
-        # R6: Merge small chunks
-        text_chunks = apply_rule_r6_merge_small(text_chunks)
-
-        # R7: Cross-reference merge
-        text_chunks = apply_rule_r7_crossref_merge(
-            text_chunks, profile.cross_reference_patterns
-        )
-
-        # R8: Figure continuity
-        if profile.figure_reference_pattern:
-            text_chunks = apply_rule_r8_figure_continuity(
-                text_chunks, profile.figure_reference_pattern
-            )
-
-        # Build hierarchical header
-        header = compose_hierarchical_header(profile, entry.hierarchy_path)
-
-        # Tag vehicle applicability
-        tags = tag_vehicle_applicability(text, profile)
-
-        # Build Chunk objects
-        for chunk_idx, chunk_text in enumerate(text_chunks):
-            chunk_id = entry.chunk_id
-            if len(text_chunks) > 1:
-                chunk_id = f"{entry.chunk_id}::part{chunk_idx + 1}"
-
-            # Extract level1_id from hierarchy_path or chunk_id.
-            # hierarchy_path[0] is the level-1 title (e.g. "0 Lubrication and Maintenance").
-            # For the ID we parse the chunk_id: "{manual_id}::{level1_id}::..."
-            level1_id = ""
-            chunk_id_parts = entry.chunk_id.split("::")
-            if len(chunk_id_parts) >= 2:
-                level1_id = chunk_id_parts[1]
-
-            metadata = {
-                "manual_id": manifest.manual_id,
-                "level1_id": level1_id,
-                "procedure_name": entry.title,
-                "hierarchical_header": header,
-                "hierarchy_path": entry.hierarchy_path,
-                "content_type": entry.content_type,
-                "page_range": asdict(entry.page_range),
-                "vehicle_models": tags["vehicle_models"],
-                "engine_applicability": tags["engine_applicability"],
-                "drivetrain_applicability": tags["drivetrain_applicability"],
-                "has_safety_callouts": entry.has_safety_callouts,
-                "figure_references": entry.figure_references,
-                "cross_references": entry.cross_references,
-            }
-
-            # Enrich metadata by scanning the actual chunk text for
-            # safety callouts, figure refs, and cross-refs.  This
-            # overwrites the manifest-entry-level values with per-chunk
-            # values that reflect what is really in this text fragment.
-            enrich_chunk_metadata(chunk_text, metadata, profile)
-
-            result_chunks.append(
-                Chunk(
-                    chunk_id=chunk_id,
-                    manual_id=manifest.manual_id,
-                    text=chunk_text,
-                    metadata=metadata,
-                )
-            )
+        jobs.append((text, entry))
+
+    # Tag vehicle applicability for every entry in one batch
+    all_tags = _tag_applicability_batch(
+        [text for text, _ in jobs], _applicability_vocabulary(profile)
+    )
+    tagged_jobs = [(text, entry, tags) for (text, entry), tags in zip(jobs, all_tags)]
+
+    assembled: list[tuple[Chunk, int]] = []
+    if workers == 1 or len(jobs) <= 1:
+        for text, entry, tags in tagged_jobs:
+            assembled.extend(_assemble_entry(text, entry, manual_id, profile, tags))
+    else:
+        # The profile is sent once per worker through the pool initializer;
+        # entries go out in contiguous batches, several per worker, so the
+        # load evens out across entries of very different sizes.
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(profile, manual_id)
+        ) as ex:
+            batch = max(1, len(jobs) // ((workers or os.cpu_count() or 1) * 4))
+            for chunks in ex.map(_assemble_entry_job, tagged_jobs, chunksize=batch):
+                assembled.extend(chunks)
 
     # Post-assembly cross-entry merge: merge tiny chunks into next sibling
     # within the same level-1 group to eliminate orphan fragments that the
     # per-entry R6 pass cannot reach (it only sees chunks within one entry).
-    result_chunks = merge_small_across_entries(result_chunks)
+    # The word counts carried out of the rules size it without recounting.
+    chunks = [chunk for chunk, _ in assembled]
+    result_chunks, kept = _merge_small_across_entries(
+        chunks, [words for _, words in assembled]
+    )
+
+    # Enrich metadata by scanning chunk text for safety callouts, figure
+    # refs, and cross-refs, overwriting the manifest-entry-level values.
+    # This is deferred until after the merge because most chunks are
+    # absorbed by it and their metadata discarded.  A surviving chunk
+    # shares the metadata dict of the chunk it kept and is enriched from
+    # that chunk's own text, exactly as if enriched during assembly.
+    for idx in kept:
+        enrich_chunk_metadata(chunks[idx].text, chunks[idx].metadata, profile)
 
     logger.debug("Assembled %d chunks from %d manifest entries", len(result_chunks), len(manifest.entries))
     return result_chunks
 
 
+# json.dumps() with any non-default option builds a fresh JSONEncoder on
+# every call; one shared encoder serves every line of a chunk file.
+_JSONL_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
 def save_chunks(chunks: list[Chunk], output_path: Path) -> None:
     """Write chunks to a JSONL file (one JSON object per line).
 
     Each line contains: chunk_id, manual_id, text, metadata.
     """
+    encode = _JSONL_ENCODER.encode
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    # Text mode is kept so line endings follow the platform as before; the
+    # newline is written on its own rather than copied onto each record.
     with open(output_path, "w", encoding="utf-8") as f:
+        write = f.write
         for chunk in chunks:
             record = {
                 "chunk_id": chunk.chunk_id,
@@ -978,7 +1679,8 @@ def save_chunks(chunks: list[Chunk], output_path: Path) -> None:
                 "text": chunk.text,
                 "metadata": chunk.metadata,
             }
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            write(encode(record))
+            write("\n")
 
 
 def load_chunks(input_path: Path) -> list[Chunk]:
@@ -995,8 +1697,8 @@ def load_chunks(input_path: Path) -> list[Chunk]:
             record = json.loads(line)
             chunks.append(
                 Chunk(
-                    chunk_id=record["chunk_id"],
-                    manual_id=record["manual_id"],
+                    chunk_id=sys.intern(record["chunk_id"]),
+                    manual_id=sys.intern(record["manual_id"]),
                     text=record["text"],
                     metadata=record["metadata"],
                 )
@@ -14,6 +14,17 @@ from .qa import ValidationReport
 logger = logging.getLogger(__name__)
 
 
+def _non_negative_int(value: str) -> int:
+    """argparse type for counts where 0 has a meaning (e.g. one per CPU)."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0, got {number}")
+    return number
+
+
 def build_parser() -> argparse.ArgumentParser:
     """Build the CLI argument parser with all subcommands."""
     parser = argparse.ArgumentParser(
@@ -52,6 +63,12 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Directory to write {manual_id}_chunks.jsonl output",
     )
+    process_parser.add_argument(
+        "--workers",
+        type=_non_negative_int,
+        default=1,
+        help="Worker processes for chunk assembly (0 = one per CPU, default 1)",
+    )
 
     # bootstrap-profile subcommand
     bootstrap_parser = subparsers.add_parser(
@@ -84,6 +101,12 @@ def build_parser() -> argparse.ArgumentParser:
         "--summary-only", action="store_true", default=False,
         help="Show only the validation summary, suppress per-issue detail",
     )
+    validate_parser.add_argument(
+        "--workers",
+        type=_non_negative_int,
+        default=1,
+        help="Worker processes for chunk assembly (0 = one per CPU, default 1)",
+    )
 
     # qa subcommand
     qa_parser = subparsers.add_parser(
@@ -221,7 +244,8 @@ def cmd_process(args: argparse.Namespace) -> int:
     logger.info("Detected %d boundaries, %d manifest entries", len(boundaries), len(manifest.entries))
 
     # 5. Assemble chunks
-    chunks = assemble_chunks(cleaned_texts, manifest, profile)
+    workers = getattr(args, "workers", 1) or None
+    chunks = assemble_chunks(cleaned_texts, manifest, profile, workers=workers)
     logger.info("Assembled %d chunks", len(chunks))
 
     # 5b. Write chunks to JSONL if --output-dir was provided
@@ -397,7 +421,8 @@ def cmd_validate(args: argparse.Namespace) -> int:
         _print_boundary_diagnostics(boundaries, cleaned_texts)
 
     # 6. Assemble chunks
-    chunks = assemble_chunks(cleaned_texts, manifest, profile)
+    workers = getattr(args, "workers", 1) or None
+    chunks = assemble_chunks(cleaned_texts, manifest, profile, workers=workers)
     logger.info("Assembled %d chunks", len(chunks))
 
     # 7. Run QA validation suite
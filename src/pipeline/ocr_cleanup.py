@@ -8,10 +8,20 @@ import unicodedata
 from dataclasses import dataclass
 from typing import Any
 
-from .profile import ManualProfile
+from .profile import ManualProfile, compile_pattern
 
 logger = logging.getLogger(__name__)
 
+# Fixed patterns, compiled at import rather than looked up in the re
+# module's cache on every page, line or word.
+_SPACED_CHARS_RE = re.compile(r'\b([A-Z] ){2,}[A-Z]\b')
+_PAGE_RANGE_RE = re.compile(r"(\d+)\s*-\s*(\d+)")
+_PAGE_DIGITS_RE = re.compile(r"(\d+)")
+_HSPACE_RE = re.compile(r"[ \t]+")
+_EXCESS_NEWLINES_RE = re.compile(r"\n{3,}")
+_WORD_RE = re.compile(r"\S+")
+_EDGE_PUNCT_RE = re.compile(r"^[^a-zA-Z0-9]+|[^a-zA-Z0-9]+$")
+
 
 @dataclass
 class CleanedPage:
@@ -44,7 +54,7 @@ def collapse_spaced_characters(text: str) -> str:
     def _collapse(match: re.Match) -> str:
         return match.group(0).replace(" ", "")
 
-    return re.sub(r'\b([A-Z] ){2,}[A-Z]\b', _collapse, text)
+    return _SPACED_CHARS_RE.sub(_collapse, text)
 
 
 def apply_known_substitutions(text: str, substitutions: list[dict[str, str]]) -> str:
@@ -79,7 +89,7 @@ def apply_regex_substitutions(
         Text with all regex substitutions applied.
     """
     for sub in substitutions:
-        text = re.sub(sub["pattern"], sub["replacement"], text)
+        text = compile_pattern(sub["pattern"]).sub(sub["replacement"], text)
     return text
 
 
@@ -89,7 +99,7 @@ def strip_headers_footers(text: str, patterns: list[str]) -> tuple[str, str | No
     Returns:
         Tuple of (cleaned text, extracted page number or None).
     """
-    compiled = [re.compile(p) for p in patterns]
+    compiled = [compile_pattern(p) for p in patterns]
     lines = text.split("\n")
     kept_lines: list[str] = []
     page_number: str | None = None
@@ -102,11 +112,11 @@ def strip_headers_footers(text: str, patterns: list[str]) -> tuple[str, str | No
                 # Try to extract a page number from the matched line
                 if page_number is None:
                     # Look for digit patterns like "0 - 12" or standalone numbers
-                    num_match = re.search(r"(\d+)\s*-\s*(\d+)", line)
+                    num_match = _PAGE_RANGE_RE.search(line)
                     if num_match:
                         page_number = f"{num_match.group(1)}-{num_match.group(2)}"
                     else:
-                        num_match = re.search(r"(\d+)", line)
+                        num_match = _PAGE_DIGITS_RE.search(line)
                         if num_match:
                             page_number = num_match.group(1)
                 break
@@ -174,13 +184,13 @@ def normalize_unicode(text: str) -> str:
     normalized_lines: list[str] = []
     for line in lines:
         # Collapse multiple spaces/tabs to single space
-        line = re.sub(r"[ \t]+", " ", line)
+        line = _HSPACE_RE.sub(" ", line)
         line = line.strip()
         normalized_lines.append(line)
     text = "\n".join(normalized_lines)
 
     # Collapse excessive newlines (more than 2) to 2
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _EXCESS_NEWLINES_RE.sub("\n\n", text)
 
     return text
 
@@ -275,12 +285,12 @@ def assess_quality(pages: list[CleanedPage], sample_size: int = 50) -> OCRQualit
 
     for page in sampled:
         text = page.cleaned_text
-        words = re.findall(r"\S+", text)
+        words = _WORD_RE.findall(text)
         total_words += len(words)
 
         for word in words:
             # Strip punctuation from word edges for checking
-            clean_word = re.sub(r"^[^a-zA-Z0-9]+|[^a-zA-Z0-9]+$", "", word)
+            clean_word = _EDGE_PUNCT_RE.sub("", word)
             if not clean_word:
                 continue
             # A word looks "dictionary-like" if it is entirely alphabetic
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -382,6 +383,22 @@ def validate_profile(profile: ManualProfile) -> list[str]:
     return errors
 
 
+@functools.lru_cache(maxsize=None)
+def compile_pattern(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    """Compile a profile pattern once per process and reuse it.
+
+    Shared by OCR cleanup and chunk assembly, which look the same profile
+    patterns up for every page, line or chunk.  Patterns stay ``str``-mode
+    on purpose: ASCII text is already stored one byte per character, so
+    ``bytes`` patterns match no faster, and they would change what
+    ``\\s``/``\\w`` and match offsets mean on non-ASCII pages.  They also
+    stay on the stdlib engine: RE2-style engines have ASCII-only classes and
+    no back-references or lookaround, so results would depend on which
+    regex package happened to be installed.
+    """
+    return re.compile(pattern, flags)
+
+
 def compile_patterns(profile: ManualProfile) -> dict[str, list[re.Pattern]]:
     """Pre-compile all regex patterns from a profile for runtime use.
 
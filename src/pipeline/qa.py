@@ -7,7 +7,7 @@ from dataclasses import dataclass, field
 
 from typing import Any
 
-from .chunk_assembly import Chunk, count_tokens
+from .chunk_assembly import _STEP_START_RE, Chunk, count_tokens
 from .profile import ManualProfile
 
 
@@ -104,14 +104,15 @@ def check_split_safety_callouts(
                     stripped = line.strip()
                     # Look for procedure content: numbered steps, lettered steps, or
                     # substantial non-callout text
-                    if re.match(r'^\(\d+\)\s', stripped) or re.match(r'^[a-z]\.\s', stripped):
+                    if _STEP_START_RE.match(stripped):
                         has_procedure = True
                         break
                     # Non-empty, non-callout continuation line that looks like content
                     if stripped and not any(p.search(stripped) for _, p in safety_patterns):
                         # Check if it's actually continuation of the callout (all caps for WARNING)
                         # or real content
-                        if not stripped.isupper() and len(stripped.split()) > 3:
+                        # maxsplit=3 yields 4 items exactly when there are > 3 words
+                        if not stripped.isupper() and len(stripped.split(None, 3)) > 3:
                             has_procedure = True
                             break
 
@@ -191,9 +192,14 @@ def check_duplicate_content(
     issues: list[ValidationIssue] = []
     seen_pairs: set[tuple[str, str]] = set()
 
-    # Pre-tokenize all chunks once
-    token_sets = [set(c.text.split()) for c in chunks]
-    token_counts = [len(c.text.split()) for c in chunks]
+    # Pre-tokenize all chunks once; each text is split a single time for
+    # both its token set and its token count.
+    token_sets: list[set[str]] = []
+    token_counts: list[int] = []
+    for c in chunks:
+        words = c.text.split()
+        token_sets.append(set(words))
+        token_counts.append(len(words))
 
     for i in range(len(chunks)):
         for j in range(i + 1, len(chunks)):
@@ -262,11 +268,11 @@ def check_cross_ref_validity(
 
     # Build skip prefixes from profile.skip_sections so that references
     # to intentionally skipped sections produce warnings, not errors.
-    skip_prefixes: set[str] = set()
+    # A tuple lets one str.startswith call test every prefix.
+    skip_prefixes: tuple[str, ...] = ()
     if profile and profile.skip_sections:
         manual_id = chunks[0].manual_id if chunks else ""
-        for sid in profile.skip_sections:
-            skip_prefixes.add(f"{manual_id}::{sid}")
+        skip_prefixes = tuple(f"{manual_id}::{sid}" for sid in profile.skip_sections)
 
     for chunk in chunks:
         cross_refs = chunk.metadata.get("cross_references", [])
@@ -315,7 +321,7 @@ def check_cross_ref_validity(
                 ):
                     continue  # resolved via content-text probe
 
-            is_skipped = any(ref.startswith(sp) for sp in skip_prefixes)
+            is_skipped = ref.startswith(skip_prefixes)
 
             # Determine severity: skipped sections always get "warning";
             # otherwise use the profile's cross_ref_unresolved_severity
@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 import logging
 import re
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Any
 
@@ -425,19 +425,39 @@ def generate_chunk_id(manual_id: str, hierarchy_ids: list[str]) -> str:
     return "::".join([manual_id] + hierarchy_ids)
 
 
+_ENTRY_FIELDS = tuple(f.name for f in fields(ManifestEntry))
+
+
+def _entry_to_dict(entry: ManifestEntry) -> dict:
+    """Plain-dict form of *entry*, keyed in field order like asdict().
+
+    The dict only feeds the JSON encoder, so field values are shared
+    rather than deep-copied; the two range dataclasses are flattened.
+    """
+    data = {name: getattr(entry, name) for name in _ENTRY_FIELDS}
+    data["page_range"] = {"start": entry.page_range.start, "end": entry.page_range.end}
+    data["line_range"] = {"start": entry.line_range.start, "end": entry.line_range.end}
+    return data
+
+
 def save_manifest(manifest: Manifest, path: Path) -> None:
     """Serialize a Manifest to a JSON file.
 
-    Uses dataclasses.asdict() for full recursive conversion, then writes
-    indented JSON for readability and diffability.
+    Converts the dataclasses to plain dicts, then writes indented JSON
+    for readability and diffability.
 
     Args:
         manifest: The Manifest object to persist.
         path: Filesystem path for the output JSON file.
     """
-    data = asdict(manifest)
+    data = {
+        "manual_id": manifest.manual_id,
+        "entries": [_entry_to_dict(entry) for entry in manifest.entries],
+    }
+    # json.dumps joins the document in one go; json.dump would write it
+    # to the file in thousands of small pieces.
     with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write(json.dumps(data, indent=2, ensure_ascii=False))
     logger.debug("Saved manifest with %d entries to %s", len(manifest.entries), path)
 
 
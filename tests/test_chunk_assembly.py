@@ -49,6 +49,9 @@ class TestCountTokens:
     def test_empty_string(self):
         assert count_tokens("") == 0
 
+    def test_whitespace_only(self):
+        assert count_tokens("  \n\t\n ") == 0
+
     def test_single_word(self):
         assert count_tokens("hello") == 1
 
@@ -117,6 +120,15 @@ class TestComposeHierarchicalHeader:
         )
         assert "TM 9-8014" in header or "M38A1" in header
 
+    def test_reflects_manual_title_changes(self, xj_profile_path):
+        profile = load_profile(xj_profile_path)
+        path = ["9 Engine", "Cylinder Head"]
+        compose_hierarchical_header(profile, path)
+        profile.manual_title = "Renamed Manual"
+        assert compose_hierarchical_header(profile, path) == (
+            "Renamed Manual | 9 Engine | Cylinder Head"
+        )
+
 
 # ── Step Sequence Detection Tests ─────────────────────────────────
 
@@ -150,6 +162,56 @@ class TestDetectStepSequences:
         sequences = detect_step_sequences(text, [r"^\((\d+)\)\s"])
         assert len(sequences) >= 2
 
+    def test_mixed_pattern_list_matches_any_pattern(self):
+        text = "Intro.\na. Lettered.\n(1) Numbered.\nEnd."
+        sequences = detect_step_sequences(text, [r"^([a-z])\.\s", r"^\((\d+)\)\s"])
+        assert sequences == [(1, 2)]
+
+    def test_back_referencing_pattern_falls_back_to_per_pattern_search(self):
+        # A back-reference can't be embedded in the combined alternation;
+        # detection must still work by testing patterns one at a time.
+        text = "Intro.\n11. Doubled.\n22. Doubled.\nEnd."
+        sequences = detect_step_sequences(text, [r"^((\d)\2)\.\s", r"^\((\d+)\)\s"])
+        assert sequences == [(1, 2)]
+
+    def test_conditional_group_reference_is_not_combined(self):
+        # "(?(1)...)" would test the other branch's group 1 in the union.
+        from pipeline.chunk_assembly import _any_search, _compile_any
+        from pipeline.profile import compile_pattern
+
+        patterns = (("(a)?b", 0), (r"(x)?(?(1)y|z)", 0))
+        assert _compile_any(patterns) is None
+        compiled = [compile_pattern(p, f) for p, f in patterns]
+        assert _any_search(_compile_any(patterns), compiled, "xy")
+
+    def test_inline_global_flag_is_not_combined(self):
+        # "(?i)" would apply to every branch of the union (and only warns
+        # on Python 3.10), so such patterns are tested one at a time.
+        from pipeline.chunk_assembly import _compile_any
+
+        assert _compile_any((("WARNING", 0), ("(?i)note", 0))) is None
+        assert _compile_any((("WARNING", 0), ("(?i:note)", 0))) is not None
+
+    def test_quantified_escaped_literal_is_not_required(self):
+        # "\(?" makes the parenthesis optional, so text without any "("
+        # must still be scanned for steps.
+        text = "Intro.\n1) First.\n2) Second.\nEnd."
+        sequences = detect_step_sequences(text, [r"^\(?(\d+)\)\s"])
+        assert sequences == [(1, 2)]
+
+    def test_indented_steps_and_first_line_are_found(self):
+        # Lines are stripped before matching, so indentation (including
+        # other whitespace such as \r or \x0b) does not hide a step, and a
+        # step on the very first line has no preceding newline.
+        text = "(1) First.\n  (2) Second.\n\r\x0b(3) Third.\nEnd."
+        sequences = detect_step_sequences(text, [r"^\((\d+)\)\s"])
+        assert sequences == [(0, 2)]
+
+    def test_unanchored_pattern_is_searched_line_by_line(self):
+        text = "Intro.\nSee (1) here.\nAnd (2) there.\nEnd."
+        sequences = detect_step_sequences(text, [r"\((\d+)\)"])
+        assert sequences == [(1, 2)]
+
 
 # ── Safety Callout Detection Tests ────────────────────────────────
 
@@ -204,6 +266,45 @@ class TestDetectSafetyCallouts:
         assert callouts[0]["level"] == "warning"
         assert "WARNING:" in callouts[0]["text"]
 
+    def test_pattern_with_optional_suffix_still_matches(self, xj_profile_path):
+        """Only the required literal prefix of a pattern gates the regex scan."""
+        profile = load_profile(xj_profile_path)
+        profile.safety_callouts = [
+            SafetyCallout(level="note", pattern="^Notes?:", style="block"),
+            SafetyCallout(level="caution", pattern="^CAUTION|^Caution", style="block"),
+        ]
+        text = "Intro line.\nNote: keep clear.\nCaution: hot surface."
+        callouts = detect_safety_callouts(text, profile)
+        assert [(c["level"], c["start_line"]) for c in callouts] == [
+            ("note", 1),
+            ("caution", 2),
+        ]
+
+    def test_pattern_with_escaped_literal_matches(self, xj_profile_path):
+        """Escaped metacharacters count toward the literal prefix."""
+        profile = load_profile(xj_profile_path)
+        profile.safety_callouts = [
+            SafetyCallout(level="warning", pattern=r"^\*WARNING\*", style="block"),
+        ]
+        assert detect_safety_callouts("WARNING: plain.", profile) == []
+        callouts = detect_safety_callouts("Intro.\n*WARNING* hot surface.", profile)
+        assert [(c["level"], c["start_line"]) for c in callouts] == [("warning", 1)]
+
+    def test_line_matching_two_patterns_reports_both(self, xj_profile_path):
+        profile = load_profile(xj_profile_path)
+        profile.safety_callouts = [
+            SafetyCallout(level="caution", pattern="^CAUTION:", style="block"),
+            SafetyCallout(level="warning", pattern="hot", style="block"),
+        ]
+        text = "Intro.\nCAUTION: hot coolant.\nStill hot.\n\nhot pipes"
+        callouts = detect_safety_callouts(text, profile)
+        assert [(c["level"], c["start_line"], c["end_line"]) for c in callouts] == [
+            ("caution", 1, 1),
+            ("warning", 1, 1),
+            ("warning", 2, 2),
+            ("warning", 4, 4),
+        ]
+
 
 # ── Table Detection Tests ─────────────────────────────────────────
 
@@ -220,6 +321,21 @@ class TestDetectTables:
         tables = detect_tables(text)
         assert tables == []
 
+    def test_line_numbers_and_header_lines(self):
+        text = (
+            "Intro paragraph.\n"
+            "SPECIFICATIONS\n"
+            "Idle speed ........ 750 rpm\n"
+            "Timing .... 10 BTDC .... max\n"
+            "\n"
+            "Prose between the tables.\n"
+            "More prose.\n"
+            "Still more prose.\n"
+            "TORQUE\n"
+            "Bolt ........ 25 Nm"
+        )
+        assert detect_tables(text) == [(1, 3), (8, 9)]
+
 
 # ── Rule R1: Primary Chunk Unit ───────────────────────────────────
 
@@ -258,6 +374,13 @@ class TestRuleR2SizeTargets:
         result = apply_rule_r2_size_targets([normal_text])
         assert len(result) == 1
 
+    def test_oversized_lines_packed_greedily_without_losing_words(self):
+        # 300 lines of 10 words: each piece takes as many whole lines as fit.
+        text = "\n".join("word " * 10 for _ in range(300))
+        result = apply_rule_r2_size_targets([text])
+        assert [count_tokens(c) for c in result] == [2000, 1000]
+        assert sum(len(c.split("\n")) for c in result) == 300
+
 
 # ── Rule R3: Never Split Steps ────────────────────────────────────
 
@@ -423,6 +546,21 @@ class TestRuleR6MergeSmall:
         result = apply_rule_r6_merge_small(["Tiny."], min_tokens=200)
         assert len(result) == 1
 
+    def test_chain_of_small_chunks_merges_until_threshold(self):
+        # 40 + 40 words stays under the 100-token threshold, adding the third
+        # 40 crosses it, so the first three collapse and the last stands alone.
+        chunks = ["word " * 40, "word " * 40, "word " * 40, "word " * 40]
+        result = apply_rule_r6_merge_small(chunks, min_tokens=200)
+        assert [count_tokens(c) for c in result] == [120, 40]
+
+    def test_merge_threshold_respects_scaling_factor(self, monkeypatch):
+        import pipeline.chunk_assembly as ca
+
+        monkeypatch.setattr(ca, "TOKEN_ESTIMATE_FACTOR", 2.0)
+        chunks = ["word " * 60, "word " * 60]
+        result = apply_rule_r6_merge_small(chunks, min_tokens=200)
+        assert len(result) == 2
+
 
 # ── Cross-Entry Merge Tests ───────────────────────────────────────
 
@@ -615,6 +753,19 @@ class TestRuleR7CrossRefMerge:
         # The second chunk has real content, should not be merged
         assert len(result) == 2
 
+    def test_consecutive_crossref_sections_merge_into_same_parent(self):
+        chunks = [
+            "Parent content.",
+            "Refer to Group 5",
+            "Refer to Group 7",
+            "Next procedure content.",
+        ]
+        result = apply_rule_r7_crossref_merge(chunks, [r"Refer to Group \d+"])
+        assert result == [
+            "Parent content.\n\nRefer to Group 5\n\nRefer to Group 7",
+            "Next procedure content.",
+        ]
+
 
 # ── Rule R8: Figure Reference Continuity ──────────────────────────
 
@@ -694,6 +845,16 @@ class TestRuleR8FigureContinuity:
         result = apply_rule_r8_figure_continuity(chunks, r"\(Fig\.\s+(\d+)\)")
         assert len(result) == 2, "First chunk with figure ref has nothing to merge into"
 
+    def test_optional_id_group_that_did_not_match(self):
+        """A pattern whose group 1 is optional compares unmatched ids as None."""
+        chunks = ["Remove the panel (see Fig. B).", "Fig. A caption"]
+        pattern = r"Fig(?:ure (\d+)|\.)( [A-Z])"
+        result = apply_rule_r8_figure_continuity(chunks, pattern)
+        # Both references leave group 1 unset, so they count as the same figure
+        assert result == ["Remove the panel (see Fig. B).\n\nFig. A caption"]
+        result = apply_rule_r8_figure_continuity(["No figure here.", "Fig. A caption"], pattern)
+        assert len(result) == 2
+
 
 # ── Vehicle Applicability Tagging Tests ───────────────────────────
 
@@ -744,6 +905,37 @@ class TestTagVehicleApplicability:
         assert "M38A1" in tags["vehicle_models"]
         assert "M170" in tags["vehicle_models"]
 
+    def test_nested_names_are_all_tagged(self, cj_profile_path):
+        profile = load_profile(cj_profile_path)
+        profile.vehicles[0].model = "CJ-5A"
+        tags = tag_vehicle_applicability(
+            "Applies to the CJ-5A with the Dauntless V-6 225.", profile
+        )
+        assert tags["vehicle_models"] == ["CJ-5A", "CJ-5"]
+        assert tags["engine_applicability"] == ["Dauntless V-6 225"]
+
+    def test_case_insensitive_match(self, xj_profile_path):
+        profile = load_profile(xj_profile_path)
+        tags = tag_vehicle_applicability("CHEROKEE XJ 4wd models.", profile)
+        assert tags["vehicle_models"] == ["Cherokee XJ"]
+        assert tags["drivetrain_applicability"] == ["4WD"]
+
+    def test_profile_edits_after_first_call_are_seen(self, xj_profile_path):
+        profile = load_profile(xj_profile_path)
+        text = "Applies to the Grand Wagoneer only."
+        assert tag_vehicle_applicability(text, profile)["vehicle_models"] == ["all"]
+
+        profile.vehicles[0].model = "Grand Wagoneer"
+        assert tag_vehicle_applicability(text, profile)["vehicle_models"] == ["Grand Wagoneer"]
+
+    def test_context_dependent_lowercase_still_matches(self, xj_profile_path):
+        # "ΑΣ".lower() ends in final sigma, but inside "ΑΣΑ" the same
+        # letter lowers to medial sigma; the exact-case search catches it.
+        profile = load_profile(xj_profile_path)
+        profile.vehicles[0].model = "ΑΣ"
+        tags = tag_vehicle_applicability("Fits the ΑΣΑ variant.", profile)
+        assert tags["vehicle_models"] == ["ΑΣ"]
+
 
 # ── Rule Ordering Guard Tests ────────────────────────────────────
 
@@ -851,6 +1043,56 @@ class TestRuleOrdering:
                 "R3 (never split steps) must run before R2 (size targets)"
             )
 
+    def test_fused_sweep_matches_sequential_rules(self, xj_profile_path):
+        """The fused R3/R4/R5/R2/R6/R7/R8 sweep equals applying each rule in turn."""
+        self._assert_fused_matches_sequential(load_profile(xj_profile_path))
+
+    def test_fused_sweep_with_empty_profile_lists(self, xj_profile_path):
+        """Rules skipped for empty profile lists leave the sweep's output unchanged."""
+        profile = load_profile(xj_profile_path)
+        profile.step_patterns = []
+        profile.safety_callouts = []
+        profile.cross_reference_patterns = []
+        profile.figure_reference_pattern = ""
+        self._assert_fused_matches_sequential(profile)
+
+    def _assert_fused_matches_sequential(self, profile):
+        from pipeline.chunk_assembly import _apply_rules_fused
+
+        chunks = [
+            "WARNING: Disconnect the battery first.",
+            "Remove the cover.\n(1) Loosen the bolts.\n(2) Lift the cover.\nClean it.",
+            "Torque specs:\nBolt ........ 25 Nm",
+            "Nut ........ 30 Nm\nWasher ........ 5 Nm",
+            "Short note.",
+            "Refer to Group 9",
+            "Remove the pump. " * 60,
+            "Tiny.",
+            "Install the pump. " * 60,
+            "Final fragment.",
+        ]
+
+        expected = [
+            part
+            for chunk in chunks
+            for part in apply_rule_r3_never_split_steps(chunk, profile.step_patterns)
+        ]
+        expected = apply_rule_r4_safety_attachment(expected, profile)
+        expected = apply_rule_r5_table_integrity(expected)
+        expected = apply_rule_r2_size_targets(expected)
+        expected = apply_rule_r6_merge_small(expected)
+        expected = apply_rule_r7_crossref_merge(
+            expected, profile.cross_reference_patterns
+        )
+        if profile.figure_reference_pattern:
+            expected = apply_rule_r8_figure_continuity(
+                expected, profile.figure_reference_pattern
+            )
+
+        fused = _apply_rules_fused(list(chunks), profile)
+        assert [text for text, _ in fused] == expected
+        assert [words for _, words in fused] == [len(t.split()) for t in expected]
+
 
 # ── Metadata Contract Tests ──────────────────────────────────────
 
@@ -957,6 +1199,40 @@ class TestMetadataContract:
         assert len(chunks) >= 1
         assert chunks[0].metadata["level1_id"] == "8A"
 
+    def test_chunks_of_one_entry_have_independent_metadata(self, xj_profile_path):
+        """Parts of one entry share metadata values but not the dict itself."""
+        profile = load_profile(xj_profile_path)
+        prose = "Inspect the cooling system before starting. " * 40
+        steps = "\n".join(f"({i}) Remove fastener number {i} from the bracket assembly." for i in range(1, 30))
+        page_text = prose + "\n" + steps
+        manifest = self._make_manifest("xj-1999", len(page_text.split("\n")))
+
+        chunks = assemble_chunks([page_text], manifest, profile)
+        assert len(chunks) == 2
+        assert chunks[0].metadata is not chunks[1].metadata
+        assert chunks[0].metadata["hierarchical_header"] == chunks[1].metadata["hierarchical_header"]
+
+        chunks[0].metadata["procedure_name"] = "changed"
+        assert chunks[1].metadata["procedure_name"] == "Jump Starting Procedure"
+
+    def test_cross_entry_merge_keeps_survivor_enrichment(self, xj_profile_path):
+        """A chunk that absorbs a tiny sibling is enriched from its own text."""
+        profile = load_profile(xj_profile_path)
+        tiny = "Check the coolant level."
+        body = "CAUTION: Use only the specified coolant.\n" + "Fill the radiator (Fig. 3) slowly. " * 60
+        pages = [tiny + "\n" + body]
+        base = self._make_manifest("xj-1999", 2).entries[0]
+        first = ManifestEntry(**{**vars(base), "chunk_id": "xj-1999::0::SP::A", "line_range": LineRange(start=0, end=1)})
+        second = ManifestEntry(**{**vars(base), "chunk_id": "xj-1999::0::SP::B", "line_range": LineRange(start=1, end=2)})
+        manifest = Manifest(manual_id="xj-1999", entries=[first, second])
+
+        chunks = assemble_chunks(pages, manifest, profile)
+        assert len(chunks) == 1
+        assert chunks[0].chunk_id == "xj-1999::0::SP::B"
+        assert chunks[0].text.startswith(tiny)
+        assert chunks[0].metadata["has_safety_callouts"] == ["caution"]
+        assert chunks[0].metadata["figure_references"] == ["3"]
+
 
 # ── Multi-Page Chunk Assembly Tests ─────────────────────────────
 
@@ -1038,6 +1314,26 @@ class TestMultiPageAssembly:
                 # (which would indicate wrong offset extraction).
                 pass  # Verified by the positive assertion above
 
+    def test_worker_pool_matches_in_process_assembly(
+        self, xj_profile_path, xj_multipage_pages
+    ):
+        """Assembling entries in worker processes yields the same chunks."""
+        profile = load_profile(xj_profile_path)
+
+        boundaries = detect_boundaries(xj_multipage_pages, profile)
+        manifest = build_manifest(boundaries, profile)
+        assert len(manifest.entries) > 1
+
+        serial = assemble_chunks(xj_multipage_pages, manifest, profile)
+        parallel = assemble_chunks(xj_multipage_pages, manifest, profile, workers=2)
+        assert parallel == serial
+
+    def test_negative_workers_rejected(self, xj_profile_path, xj_multipage_pages):
+        profile = load_profile(xj_profile_path)
+        manifest = build_manifest(detect_boundaries(xj_multipage_pages, profile), profile)
+        with pytest.raises(ValueError, match="workers"):
+            assemble_chunks(xj_multipage_pages, manifest, profile, workers=-2)
+
 
 # ── Three-Page Multi-Page Chunk Assembly Tests ───────────────────
 
@@ -1450,6 +1746,33 @@ class TestSaveChunks:
         assert output.exists()
         assert output.read_text(encoding="utf-8") == ""
 
+    def test_lines_match_json_dumps(self, tmp_path):
+        import json
+
+        chunks = self._make_chunks()
+        chunks[0] = Chunk(
+            chunk_id=chunks[0].chunk_id,
+            manual_id=chunks[0].manual_id,
+            text="Torque to 50 N\u00b7m \u2014 see caf\u00e9 \"note\".",
+            metadata=chunks[0].metadata,
+        )
+        output = tmp_path / "chunks.jsonl"
+        save_chunks(chunks, output)
+        expected = "".join(
+            json.dumps(
+                {
+                    "chunk_id": c.chunk_id,
+                    "manual_id": c.manual_id,
+                    "text": c.text,
+                    "metadata": c.metadata,
+                },
+                ensure_ascii=False,
+            )
+            + "\n"
+            for c in chunks
+        )
+        assert output.read_text(encoding="utf-8") == expected
+
 
 class TestLoadChunks:
     """Test JSONL import of chunks."""
@@ -1494,6 +1817,29 @@ class TestLoadChunks:
         loaded = load_chunks(output)
         assert len(loaded) == 2
 
+    def test_ids_are_shared_across_loaded_chunks(self, tmp_path):
+        import json
+
+        output = tmp_path / "chunks.jsonl"
+        records = [
+            {"chunk_id": f"m1::s{i}", "manual_id": "m1", "text": "Hi.", "metadata": {}}
+            for i in range(2)
+        ]
+        output.write_text("".join(json.dumps(r) + "\n" for r in records), encoding="utf-8")
+        loaded = load_chunks(output)
+        assert loaded[0].manual_id is loaded[1].manual_id
+
+    def test_loaded_chunks_are_immutable(self, tmp_path):
+        import dataclasses
+        import json
+
+        output = tmp_path / "chunks.jsonl"
+        record = {"chunk_id": "m1::s1", "manual_id": "m1", "text": "Hi.", "metadata": {}}
+        output.write_text(json.dumps(record) + "\n", encoding="utf-8")
+        chunk = load_chunks(output)[0]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            chunk.text = "changed"
+
 
 class TestChunkPersistenceRoundTrip:
     """Test save -> load round-trip preserves chunk data exactly."""
@@ -1658,6 +2004,20 @@ class TestEnrichChunkMetadata:
         enrich_chunk_metadata(text, metadata, profile)
         assert metadata["has_safety_callouts"] == ["caution", "warning"]
 
+    def test_callout_levels_match_detected_callouts(self, xj_profile_path):
+        """Levels equal those of detect_safety_callouts, with shared-level patterns."""
+        profile = load_profile(xj_profile_path)
+        profile.safety_callouts = [
+            SafetyCallout(level="warning", pattern="^DANGER:", style="block"),
+            SafetyCallout(level="warning", pattern="^WARNING:", style="block"),
+            SafetyCallout(level="note", pattern="note:", style="inline"),
+        ]
+        text = "Intro.\n  WARNING: Hot.\nNOTE: Check twice.\nWARNING: Again."
+        metadata: dict = {}
+        enrich_chunk_metadata(text, metadata, profile)
+        detected = sorted({c["level"] for c in detect_safety_callouts(text, profile)})
+        assert metadata["has_safety_callouts"] == detected == ["note", "warning"]
+
     def test_multiple_figure_refs_deduplicated(self, xj_profile_path):
         """Multiple occurrences of the same figure ref are deduplicated."""
         profile = load_profile(xj_profile_path)
@@ -74,6 +74,36 @@ class TestBuildParser:
         ])
         assert args.output_dir is None
 
+    def test_process_workers_defaults_to_one(self):
+        parser = build_parser()
+        args = parser.parse_args([
+            "process", "--profile", "p.yaml", "--pdf", "m.pdf",
+        ])
+        assert args.workers == 1
+
+    def test_process_accepts_workers(self):
+        parser = build_parser()
+        args = parser.parse_args([
+            "process", "--profile", "p.yaml", "--pdf", "m.pdf", "--workers", "4",
+        ])
+        assert args.workers == 4
+
+    def test_validate_accepts_workers(self):
+        parser = build_parser()
+        args = parser.parse_args([
+            "validate", "--profile", "p.yaml", "--pdf", "m.pdf", "--workers", "0",
+        ])
+        assert args.workers == 0
+
+    @pytest.mark.parametrize("command", ["process", "validate"])
+    def test_negative_workers_rejected(self, command, capsys):
+        parser = build_parser()
+        with pytest.raises(SystemExit):
+            parser.parse_args([
+                command, "--profile", "p.yaml", "--pdf", "m.pdf", "--workers", "-2",
+            ])
+        assert "must be >= 0" in capsys.readouterr().err
+
     def test_verbose_flag_accepted(self):
         parser = build_parser()
         args = parser.parse_args(["--verbose", "process", "--profile", "p.yaml", "--pdf", "m.pdf"])
@@ -6,7 +6,7 @@ from pathlib import Path
 
 import pytest
 
-from pipeline import extract_pages
+from pipeline import extract_pages, iter_pages
 from pipeline.profile import load_profile, validate_profile
 from pipeline.ocr_cleanup import clean_page, assess_quality
 from pipeline.structural_parser import detect_boundaries, build_manifest, validate_boundaries
@@ -57,6 +57,14 @@ class TestPDFExtraction:
         with pytest.raises(FileNotFoundError):
             extract_pages(tmp_path / "nonexistent.pdf")
 
+    def test_iter_pages_missing_pdf_raises_on_call(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            iter_pages(tmp_path / "nonexistent.pdf")
+
+    @_skip_tm9
+    def test_iter_pages_matches_extract_pages(self):
+        assert list(iter_pages(TM9_PDF)) == extract_pages(TM9_PDF)
+
 
 # ── XJ Full Pipeline ─────────────────────────────────────────────
 